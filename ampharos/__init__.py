@@ -4,6 +4,121 @@ __license__ = "MIT"
 __copyright__ = "Copyright 2019-present Bijij"
 __version__ = "3.1.0"
 
-from . import tables as tables
-from .search import *
-from .setup import setup_ampharos as setup_ampharos
+from importlib import import_module
+
+# Avoids importing typing, which is comparatively slow to import
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from . import tables as tables
+    from .concurrency import set_max_concurrency as set_max_concurrency
+    from .index import rebuild_indexes as rebuild_indexes, set_pg_trgm as set_pg_trgm
+    from .instrumentation import add_hook as add_hook, instrument as instrument, remove_hook as remove_hook
+    from .query import find_moves as find_moves, find_pokemon as find_pokemon
+    from .search import *
+    from .setup import setup_ampharos as setup_ampharos
+    from .statements import set_prepared_statements as set_prepared_statements
+
+# Submodules and their exports are imported on first access, as asyncpg and donphan are slow to import
+_SUBMODULES = frozenset(
+    (
+        "cache",
+        "concurrency",
+        "effectiveness",
+        "index",
+        "instrumentation",
+        "loader",
+        "memory",
+        "query",
+        "search",
+        "setup",
+        "snapshot",
+        "statements",
+        "stats",
+        "tables",
+        "types",
+        "utils",
+        "views",
+    )
+)
+
+_SEARCH = (
+    "ability",
+    "item",
+    "move",
+    "pokemon",
+    "ability_many",
+    "item_many",
+    "move_many",
+    "pokemon_many",
+    "autocomplete",
+    "all_abilities",
+    "all_items",
+    "all_moves",
+    "all_pokemon",
+    "random_ability",
+    "random_item",
+    "random_move",
+    "random_pokemon",
+)
+
+_EXPORTS: dict[str, str] = {
+    "set_max_concurrency": "concurrency",
+    "rebuild_indexes": "index",
+    "set_pg_trgm": "index",
+    "setup_ampharos": "setup",
+    "set_prepared_statements": "statements",
+    "find_pokemon": "query",
+    "find_moves": "query",
+    "add_hook": "instrumentation",
+    "remove_hook": "instrumentation",
+    "instrument": "instrumentation",
+    **{name: "search" for name in _SEARCH},
+}
+
+# Written out so static tools can see the lazy exports, kept in sync with _EXPORTS
+__all__ = (
+    "tables",
+    "set_max_concurrency",
+    "rebuild_indexes",
+    "set_pg_trgm",
+    "setup_ampharos",
+    "set_prepared_statements",
+    "find_pokemon",
+    "find_moves",
+    "add_hook",
+    "remove_hook",
+    "instrument",
+    "ability",
+    "item",
+    "move",
+    "pokemon",
+    "ability_many",
+    "item_many",
+    "move_many",
+    "pokemon_many",
+    "autocomplete",
+    "all_abilities",
+    "all_items",
+    "all_moves",
+    "all_pokemon",
+    "random_ability",
+    "random_item",
+    "random_move",
+    "random_pokemon",
+)
+
+
+def __getattr__(name: str) -> object:
+    if name in _SUBMODULES:
+        return import_module(f".{name}", __name__)
+
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = globals()[name] = getattr(import_module(f".{module}", __name__), name)
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_SUBMODULES, *_EXPORTS})
@@ -0,0 +1,169 @@
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from functools import wraps
+from typing import Any, Generic, NamedTuple, TypeVar
+
+from donphan import Table
+
+from .concurrency import Executor
+
+__all__ = (
+    "CacheInfo",
+    "LRUCache",
+    "enable_cache",
+    "disable_cache",
+    "clear_cache",
+    "cache_info",
+)
+
+K = TypeVar("K")
+V = TypeVar("V")
+T = TypeVar("T")
+
+MISSING: Any = object()
+
+
+class CacheInfo(NamedTuple):
+    """Statistics for the search result cache."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class LRUCache(Generic[K, V]):
+    """A least recently used cache with optional time based expiry.
+
+    Args:
+        maxsize (int): The maximum number of entries to hold.
+        ttl (Optional[float]): The number of seconds after which entries expire.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float | None = None) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: K) -> V:
+        """Returns the cached value for a key, or ``MISSING`` if it is not cached or has expired."""
+        try:
+            expires, value = self._entries[key]
+        except KeyError:
+            return MISSING
+
+        if self.ttl is not None and expires < time.monotonic():
+            del self._entries[key]
+            return MISSING
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: K, value: V) -> None:
+        """Caches a value, evicting the least recently used entry if the cache is full."""
+        expires = time.monotonic() + self.ttl if self.ttl is not None else 0.0
+        self._entries[key] = (expires, value)
+        self._entries.move_to_end(key)
+
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Removes every entry from the cache."""
+        self._entries.clear()
+
+
+class _SearchCache:
+    def __init__(self, maxsize: int, ttl: float | None) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.maxsize = maxsize
+        # Search terms map to resolved terms, which map to results, so different
+        # search terms which resolve to the same term share a single entry.
+        self.terms: LRUCache[tuple[str, str], str | None] = LRUCache(maxsize, ttl)
+        self.results: LRUCache[tuple[str, str], Any] = LRUCache(maxsize, ttl)
+
+    def get(self, table: str, search_term: str) -> Any:
+        term = self.terms.get((table, search_term))
+        if term is None:
+            self.hits += 1
+            return None
+
+        result = self.results.get((table, term)) if term is not MISSING else MISSING
+        if result is MISSING:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return result
+
+    def set(self, table: str, search_term: str, result: Any) -> Any:
+        term = getattr(result, "_term", None)
+        self.terms.set((table, search_term), term)
+        if term is None:
+            return None
+
+        # Prefer an already cached result for the same term
+        cached = self.results.get((table, term))
+        if cached is MISSING:
+            self.results.set((table, term), result)
+            return result
+        return cached
+
+
+_CACHE: _SearchCache | None = None
+
+
+def cached(table: type[Table]) -> Callable[[Callable[[Executor, str], Awaitable[T]]], Callable[..., Awaitable[T]]]:
+    """Caches the results of a search function when the cache is enabled."""
+
+    def decorator(func: Callable[[Executor, str], Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        @wraps(func)
+        async def wrapper(connection: Executor, /, search_term: str) -> T:
+            cache = _CACHE
+            if cache is None:
+                return await func(connection, search_term)
+
+            # Search terms are not normalised, as their case and whitespace may change the result
+            result = cache.get(table._name, search_term)
+            if result is MISSING:
+                result = cache.set(table._name, search_term, await func(connection, search_term))
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def enable_cache(maxsize: int = 1024, ttl: float | None = None) -> None:
+    """Enables caching of search results.
+
+    Args:
+        maxsize (int): The maximum number of search terms and results to cache.
+        ttl (Optional[float]): The number of seconds after which cached results expire.
+    """
+    global _CACHE
+    _CACHE = _SearchCache(maxsize, ttl)
+
+
+def disable_cache() -> None:
+    """Disables caching of search results, discarding any cached results."""
+    global _CACHE
+    _CACHE = None
+
+
+def clear_cache() -> None:
+    """Discards all cached search results."""
+    if _CACHE is not None:
+        _CACHE.terms.clear()
+        _CACHE.results.clear()
+
+
+def cache_info() -> CacheInfo:
+    """Returns hit and miss statistics for the search result cache."""
+    if _CACHE is None:
+        return CacheInfo(0, 0, 0, 0)
+    return CacheInfo(_CACHE.hits, _CACHE.misses, _CACHE.maxsize, len(_CACHE.results))
@@ -0,0 +1,107 @@
+import asyncio
+import weakref
+from collections.abc import AsyncIterator, Awaitable
+from contextlib import asynccontextmanager
+from typing import Any, TypeVar
+
+import asyncpg
+from asyncpg.pool import PoolConnectionProxy
+
+__all__ = (
+    "Connection",
+    "Executor",
+    "set_max_concurrency",
+    "get_max_concurrency",
+    "acquire",
+    "gather",
+)
+
+T = TypeVar("T")
+
+# Connections acquired from a pool are proxies to the underlying connection
+Connection = asyncpg.Connection | PoolConnectionProxy
+
+# Public functions accept either a single connection or a pool to acquire connections from
+Executor = Connection | asyncpg.Pool
+
+_MAX_CONCURRENCY = 4
+
+# Semaphores are bound to the event loop they are first used in
+_SEMAPHORES: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = weakref.WeakKeyDictionary()
+
+
+def set_max_concurrency(limit: int) -> None:
+    """Sets the maximum number of connections Ampharos acquires from a pool at once.
+
+    This bounds the connections used across all concurrent lookups, so a burst of lookups
+    cannot starve the pool of connections for the rest of the application. Iterations over
+    all rows, such as :func:`search.all_pokemon`, each hold a connection outside of this limit.
+
+    Args:
+        limit (int): The maximum number of connections, defaults to ``4``.
+    Raises:
+        ValueError: The limit is less than one.
+    """
+    global _MAX_CONCURRENCY
+    if limit < 1:
+        raise ValueError("The concurrency limit must be at least 1")
+    _MAX_CONCURRENCY = limit
+    _SEMAPHORES.clear()
+
+
+def get_max_concurrency() -> int:
+    """Returns the maximum number of connections Ampharos acquires from a pool at once."""
+    return _MAX_CONCURRENCY
+
+
+def _semaphore() -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    semaphore = _SEMAPHORES.get(loop)
+    if semaphore is None:
+        semaphore = _SEMAPHORES[loop] = asyncio.Semaphore(_MAX_CONCURRENCY)
+    return semaphore
+
+
+@asynccontextmanager
+async def acquire(connection: Executor, /, *, bounded: bool = True) -> AsyncIterator[Connection]:
+    """Yields a connection, acquiring one from the pool if a pool was given.
+
+    Connections must not be acquired while another is held by the same call,
+    as doing so could wait on the concurrency limit forever.
+
+    Args:
+        bounded (bool): Whether the connection counts towards the concurrency limit. Connections
+            held for as long as the caller iterates, such as those streaming from a cursor, are
+            not bounded, as lookups made while iterating would otherwise wait on them forever.
+    """
+    if not isinstance(connection, asyncpg.Pool):
+        yield connection
+        return
+
+    if not bounded:
+        async with connection.acquire() as acquired:
+            yield acquired
+        return
+
+    async with _semaphore(), connection.acquire() as acquired:
+        yield acquired
+
+
+async def gather(connection: Executor, /, *awaitables: Awaitable[Any]) -> list[Any]:
+    """Awaits independent queries, concurrently if a pool was given.
+
+    A single connection can only run one query at a time, so the queries are awaited in order.
+    """
+    if isinstance(connection, asyncpg.Pool):
+        return await asyncio.gather(*awaitables)
+
+    results: list[Any] = []
+    try:
+        for awaitable in awaitables:
+            results.append(await awaitable)
+    finally:
+        # Close the coroutines which were not awaited due to an exception
+        for awaitable in awaitables[len(results) + 1 :]:
+            if asyncio.iscoroutine(awaitable):
+                awaitable.close()
+    return results
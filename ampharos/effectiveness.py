@@ -0,0 +1,208 @@
+from collections import defaultdict
+from collections.abc import Iterable
+
+from . import tables, types
+from .concurrency import Executor
+from .instrumentation import fetch
+from .tables import Typing
+
+__all__ = (
+    "CHART",
+    "effectiveness",
+    "defensive_multipliers",
+    "move_effectiveness",
+    "TypeIndex",
+    "get_type_index",
+    "clear_type_index",
+)
+
+_SUPER_EFFECTIVE: dict[str, tuple[str, ...]] = {
+    "FIGHTING": ("NORMAL", "ROCK", "STEEL", "ICE", "DARK"),
+    "FLYING": ("FIGHTING", "BUG", "GRASS"),
+    "POISON": ("GRASS", "FAIRY"),
+    "GROUND": ("POISON", "ROCK", "STEEL", "FIRE", "ELECTRIC"),
+    "ROCK": ("FLYING", "BUG", "FIRE", "ICE"),
+    "BUG": ("GRASS", "PSYCHIC", "DARK"),
+    "GHOST": ("GHOST", "PSYCHIC"),
+    "STEEL": ("ROCK", "ICE", "FAIRY"),
+    "FIRE": ("BUG", "STEEL", "GRASS", "ICE"),
+    "WATER": ("GROUND", "ROCK", "FIRE"),
+    "GRASS": ("GROUND", "ROCK", "WATER"),
+    "ELECTRIC": ("FLYING", "WATER"),
+    "PSYCHIC": ("FIGHTING", "POISON"),
+    "ICE": ("FLYING", "GROUND", "GRASS", "DRAGON"),
+    "DRAGON": ("DRAGON",),
+    "DARK": ("GHOST", "PSYCHIC"),
+    "FAIRY": ("FIGHTING", "DRAGON", "DARK"),
+}
+
+_NOT_VERY_EFFECTIVE: dict[str, tuple[str, ...]] = {
+    "NORMAL": ("ROCK", "STEEL"),
+    "FIGHTING": ("FLYING", "POISON", "BUG", "PSYCHIC", "FAIRY"),
+    "FLYING": ("ROCK", "STEEL", "ELECTRIC"),
+    "POISON": ("POISON", "GROUND", "ROCK", "GHOST"),
+    "GROUND": ("BUG", "GRASS"),
+    "ROCK": ("FIGHTING", "GROUND", "STEEL"),
+    "BUG": ("FIGHTING", "FLYING", "POISON", "GHOST", "STEEL", "FIRE", "FAIRY"),
+    "GHOST": ("DARK",),
+    "STEEL": ("STEEL", "FIRE", "WATER", "ELECTRIC"),
+    "FIRE": ("ROCK", "FIRE", "WATER", "DRAGON"),
+    "WATER": ("WATER", "GRASS", "DRAGON"),
+    "GRASS": ("FLYING", "POISON", "BUG", "STEEL", "FIRE", "GRASS", "DRAGON"),
+    "ELECTRIC": ("GRASS", "ELECTRIC", "DRAGON"),
+    "PSYCHIC": ("STEEL", "PSYCHIC"),
+    "ICE": ("STEEL", "FIRE", "WATER", "ICE"),
+    "DRAGON": ("STEEL",),
+    "DARK": ("FIGHTING", "DARK", "FAIRY"),
+    "FAIRY": ("POISON", "STEEL", "FIRE"),
+}
+
+_NO_EFFECT: dict[str, tuple[str, ...]] = {
+    "NORMAL": ("GHOST",),
+    "FIGHTING": ("GHOST",),
+    "POISON": ("STEEL",),
+    "GROUND": ("FLYING",),
+    "GHOST": ("NORMAL",),
+    "ELECTRIC": ("GROUND",),
+    "PSYCHIC": ("DARK",),
+    "DRAGON": ("FAIRY",),
+}
+
+
+def _build_chart() -> tuple[tuple[float, ...], ...]:
+    chart = [[1.0] * len(Typing) for _ in Typing]
+    for multiplier, matchups in ((2.0, _SUPER_EFFECTIVE), (0.5, _NOT_VERY_EFFECTIVE), (0.0, _NO_EFFECT)):
+        for attacking, defending in matchups.items():
+            for name in defending:
+                chart[Typing[attacking].value - 1][Typing[name].value - 1] = multiplier
+    return tuple(map(tuple, chart))
+
+
+# CHART[attacking.value - 1][defending.value - 1] is the multiplier of an attack against a single type
+CHART = _build_chart()
+
+# The multipliers of every attacking type against every single and dual type, in the order of Typing
+_DEFENSIVE: dict[tuple[Typing, Typing | None], tuple[float, ...]] = {
+    (primary, secondary): tuple(
+        row[primary.value - 1] * (row[secondary.value - 1] if secondary is not None and secondary != primary else 1.0)
+        for row in CHART
+    )
+    for primary in Typing
+    for secondary in (None, *Typing)
+}
+
+_TYPE_INDEX: "TypeIndex | None" = None
+
+
+def _multipliers(primary: Typing | str, secondary: Typing | str | None) -> tuple[float, ...]:
+    # Enums are returned as strings when the codecs are not registered on the connection
+    if isinstance(primary, str):
+        primary = Typing[primary]
+    if isinstance(secondary, str):
+        secondary = Typing[secondary]
+    return _DEFENSIVE[(primary, secondary)]
+
+
+def effectiveness(attacking: Typing, primary: Typing, secondary: Typing | None = None) -> float:
+    """Returns the multiplier of an attacking type against a single or dual type.
+
+    Args:
+        attacking (types.Typing): The attacking type.
+        primary (types.Typing): The defending primary type.
+        secondary (Optional[types.Typing]): The defending secondary type.
+    Returns:
+        float: The damage multiplier.
+    """
+    return _multipliers(primary, secondary)[attacking.value - 1]
+
+
+def defensive_multipliers(typing: types.PokemonTypings) -> dict[Typing, float]:
+    """Returns the multiplier of every attacking type against a Pokemon's typing.
+
+    Args:
+        typing (types.PokemonTypings): The defending typing.
+    Returns:
+        Dict[types.Typing, float]: The damage multiplier of each attacking type.
+    """
+    return dict(zip(Typing, _multipliers(typing.primary, typing.secondary)))
+
+
+def move_effectiveness(move: types.Move, pokemon: types.Pokemon) -> float:
+    """Returns the type multiplier of a move against a Pokemon.
+
+    Only the types are considered, the move's category, abilities and other effects are not.
+
+    Args:
+        move (types.Move): The attacking move.
+        pokemon (types.Pokemon): The defending Pokemon.
+    Returns:
+        float: The damage multiplier, ``1.0`` if the Pokemon's typing is unknown.
+    """
+    if pokemon.typing is None:
+        return 1.0
+    attacking = Typing[move.type] if isinstance(move.type, str) else move.type
+    return _multipliers(pokemon.typing.primary, pokemon.typing.secondary)[attacking.value - 1]
+
+
+class TypeIndex:
+    """A process-local index of Pokemon by their defensive type matchups.
+
+    Pokemon are grouped by the multiplier of each attacking type against them, so finding every
+    Pokemon weak to, resisting or immune to a type does not require checking every Pokemon.
+
+    Args:
+        typings (Iterable[Tuple[str, types.Typing, Optional[types.Typing]]]): The terms of the Pokemon and their types.
+    """
+
+    def __init__(self, typings: Iterable[tuple[str, Typing | str, Typing | str | None]]) -> None:
+        self._multipliers: dict[str, tuple[float, ...]] = {}
+        self._index: dict[Typing, dict[float, list[str]]] = {typing: defaultdict(list) for typing in Typing}
+
+        for term, primary, secondary in typings:
+            multipliers = self._multipliers[term] = _multipliers(primary, secondary)
+            for typing, multiplier in zip(Typing, multipliers):
+                self._index[typing][multiplier].append(term)
+
+    def __len__(self) -> int:
+        return len(self._multipliers)
+
+    def multiplier(self, attacking: Typing, term: str) -> float:
+        """Returns the multiplier of an attacking type against a Pokemon.
+
+        Raises:
+            KeyError: The Pokemon is not in the index.
+        """
+        return self._multipliers[term][attacking.value - 1]
+
+    def with_multiplier(self, attacking: Typing, multiplier: float) -> list[str]:
+        """Returns the terms of every Pokemon which take the given multiplier from an attacking type."""
+        return list(self._index[attacking].get(multiplier, []))
+
+    def weak_to(self, attacking: Typing) -> list[str]:
+        """Returns the terms of every Pokemon which take super effective damage from an attacking type."""
+        return [term for multiplier, terms in self._index[attacking].items() if multiplier > 1 for term in terms]
+
+    def resists(self, attacking: Typing) -> list[str]:
+        """Returns the terms of every Pokemon which take not very effective damage from an attacking type."""
+        return [term for multiplier, terms in self._index[attacking].items() if 0 < multiplier < 1 for term in terms]
+
+    def immune_to(self, attacking: Typing) -> list[str]:
+        """Returns the terms of every Pokemon which take no damage from an attacking type."""
+        return self.with_multiplier(attacking, 0.0)
+
+
+async def get_type_index(connection: Executor, /) -> TypeIndex:
+    """Returns the :class:`TypeIndex` of every Pokemon, building it on first use."""
+    global _TYPE_INDEX
+    if _TYPE_INDEX is None:
+        records = await fetch(
+            connection, f"SELECT term, first::text, second::text FROM {tables.PokemonTypes._name} ORDER BY term"
+        )
+        _TYPE_INDEX = TypeIndex((record[0], record[1], record[2]) for record in records)
+    return _TYPE_INDEX
+
+
+def clear_type_index() -> None:
+    """Discards the :class:`TypeIndex`, it will be rebuilt on next use."""
+    global _TYPE_INDEX
+    _TYPE_INDEX = None
@@ -0,0 +1,450 @@
+import bisect
+import difflib
+import heapq
+import re
+import unicodedata
+from collections import Counter, defaultdict
+from collections.abc import Iterable
+
+from donphan import Table
+
+from . import tables
+from .concurrency import Executor, gather
+from .instrumentation import fetch
+
+__all__ = (
+    "TermIndex",
+    "NameIndex",
+    "PrefixIndex",
+    "EvolutionGraph",
+    "normalise_name",
+    "parse_dex_no",
+    "check_searchable",
+    "get_index",
+    "get_name_index",
+    "get_prefix_index",
+    "get_evolution_graph",
+    "rebuild_indexes",
+    "clear_indexes",
+    "create_trigram_indexes",
+    "set_pg_trgm",
+)
+
+SEARCHABLE_TABLES: list[type[Table]] = [
+    tables.Abilities,
+    tables.Items,
+    tables.Moves,
+    tables.Pokemon,
+]
+
+_INDEXES: dict[type[Table], "TermIndex"] = {}
+_NAME_INDEX: "NameIndex | None" = None
+_PREFIX_INDEXES: dict[type[Table], "PrefixIndex"] = {}
+_EVOLUTION_GRAPH: "EvolutionGraph | None" = None
+
+# Pokedex numbers are stored as a smallint
+_MAX_DEX_NO = 32767
+
+_KANA = re.compile("[\u3040-\u30ff\u31f0-\u31ff]")
+_HIRAGANA_TO_KATAKANA = {code: code + 0x60 for code in range(0x3041, 0x3097)}
+
+_USE_PG_TRGM: bool = False
+
+
+class TermIndex:
+    """A process-local fuzzy index over a set of search terms.
+
+    Each term's character counts are kept in an inverted index, which gives an upper bound on the
+    :class:`difflib.SequenceMatcher` ratio between a search term and every indexed term. Only terms whose
+    bound can beat the current best match are scored, so results are identical to
+    :func:`difflib.get_close_matches` without comparing the search term against every term.
+
+    Args:
+        terms (Iterable[str]): The terms to index.
+    """
+
+    def __init__(self, terms: Iterable[str]) -> None:
+        self.terms: list[str] = list(dict.fromkeys(terms))
+        self._exact: frozenset[str] = frozenset(self.terms)
+        self._lengths: list[int] = [len(term) for term in self.terms]
+        self._postings: dict[str, list[list[int]]] = defaultdict(list)
+
+        # _postings[char][k] lists every term containing at least k + 1 of char
+        for i, term in enumerate(self.terms):
+            for char, count in Counter(term).items():
+                postings = self._postings[char]
+                while len(postings) < count:
+                    postings.append([])
+                for k in range(count):
+                    postings[k].append(i)
+
+    def __len__(self) -> int:
+        return len(self.terms)
+
+    def __contains__(self, term: object) -> bool:
+        return term in self._exact
+
+    def get_close_matches(self, word: str, n: int = 3, cutoff: float = 0.6) -> list[str]:
+        """Returns the best matching terms for a word.
+
+        Args:
+            word (str): The word to match.
+            n (int): The maximum number of matches to return.
+            cutoff (float): The minimum similarity ratio of a match.
+        Returns:
+            List[str]: The matching terms, best match first.
+        """
+        if word in self._exact and n == 1:
+            return [word]
+
+        common: Counter[int] = Counter()
+        for char, count in Counter(word).items():
+            for postings in self._postings.get(char, [])[:count]:
+                common.update(postings)
+
+        length = len(word)
+        lengths = self._lengths
+        bounds = [
+            (-2.0 * matching / (length + lengths[i]), i)
+            for i, matching in common.items()
+            if 2.0 * matching >= cutoff * (length + lengths[i])
+        ]
+        heapq.heapify(bounds)
+
+        matcher = difflib.SequenceMatcher()
+        matcher.set_seq2(word)
+        result: list[tuple[float, str]] = []
+
+        while bounds:
+            bound, i = heapq.heappop(bounds)
+            if len(result) == n and -bound < result[0][0]:
+                break
+
+            matcher.set_seq1(self.terms[i])
+            ratio = matcher.ratio()
+            if ratio >= cutoff:
+                if len(result) < n:
+                    heapq.heappush(result, (ratio, self.terms[i]))
+                else:
+                    heapq.heappushpop(result, (ratio, self.terms[i]))
+
+        return [term for _, term in sorted(result, reverse=True)]
+
+
+def normalise_name(name: str) -> str:
+    """Normalises a name for matching.
+
+    Names are NFKC normalised and casefolded, with whitespace collapsed. Hiragana is converted to
+    katakana, and accents are removed from names which do not contain kana.
+
+    Args:
+        name (str): The name to normalise.
+    Returns:
+        str: The normalised name.
+    """
+    name = unicodedata.normalize("NFKC", name).casefold()
+    if _KANA.search(name):
+        name = name.translate(_HIRAGANA_TO_KATAKANA)
+    else:
+        name = "".join(char for char in unicodedata.normalize("NFKD", name) if not unicodedata.combining(char))
+    return " ".join(name.split())
+
+
+def parse_dex_no(search_term: str) -> int | None:
+    """Parses a search term consisting only of decimal digits as a Pokedex number.
+
+    Args:
+        search_term (str): The search term, for which :meth:`str.isdecimal` is true.
+    Returns:
+        Optional[int]: The Pokedex number, or ``None`` if no Pokemon could have the number.
+    """
+    dex_no = int(search_term)
+    return dex_no if 1 <= dex_no <= _MAX_DEX_NO else None
+
+
+def check_searchable(table: type[Table]) -> None:
+    """Checks that a table is one of the searchable tables.
+
+    Raises:
+        ValueError: The table is not :class:`tables.Abilities`, :class:`tables.Items`,
+            :class:`tables.Moves` or :class:`tables.Pokemon`.
+    """
+    if table not in SEARCHABLE_TABLES:
+        expected = ", ".join(searchable.__name__ for searchable in SEARCHABLE_TABLES)
+        raise ValueError(f"Cannot search {table.__name__}, expected one of {expected}")
+
+
+class NameIndex:
+    """A process-local index of Pokemon names in every language.
+
+    Names are normalised with :func:`normalise_name`, so matching ignores case, accents, spacing
+    and whether kana is written in hiragana or katakana.
+
+    Args:
+        names (Iterable[Tuple[str, Iterable[Optional[str]]]]): Pairs of Pokemon terms and their names.
+    """
+
+    def __init__(self, names: Iterable[tuple[str, Iterable[str | None]]]) -> None:
+        names = list(names)
+        self._terms: dict[str, str] = {}
+
+        # Terms take priority over any name which normalises to the same key
+        for term, _ in names:
+            self._terms.setdefault(normalise_name(term), term)
+        for term, aliases in names:
+            for alias in aliases:
+                if alias:
+                    self._terms.setdefault(normalise_name(alias), term)
+
+        self._kana = TermIndex(key for key in self._terms if _KANA.search(key))
+
+    def __len__(self) -> int:
+        return len(self._terms)
+
+    def resolve(self, name: str) -> str | None:
+        """Resolves a name to a Pokemon term.
+
+        Names are matched exactly after normalisation, names written in kana are also fuzzy matched.
+
+        Args:
+            name (str): The English, Romaji or Kana name to resolve.
+        Returns:
+            Optional[str]: The term of the matching Pokemon.
+        """
+        key = normalise_name(name)
+        term = self._terms.get(key)
+
+        if term is None and _KANA.search(key):
+            matches = self._kana.get_close_matches(key, 1)
+            if matches:
+                term = self._terms[matches[0]]
+
+        return term
+
+
+class PrefixIndex:
+    """A process-local index for completing search terms from a prefix.
+
+    Terms and their names are normalised with :func:`normalise_name` and kept in a sorted list,
+    so completions are found with a binary search rather than a scan of every term.
+
+    Args:
+        names (Iterable[Tuple[str, Iterable[Optional[str]]]]): Pairs of terms and their names.
+    """
+
+    def __init__(self, names: Iterable[tuple[str, Iterable[str | None]]]) -> None:
+        entries = sorted({(normalise_name(name), term) for term, aliases in names for name in (term, *aliases) if name})
+        self._keys: list[str] = [key for key, _ in entries]
+        self._terms: list[str] = [term for _, term in entries]
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def complete(self, prefix: str, limit: int = 25) -> list[str]:
+        """Returns the terms with a term or name starting with a prefix.
+
+        Args:
+            prefix (str): The prefix to complete.
+            limit (int): The maximum number of terms to return.
+        Returns:
+            List[str]: The matching terms, ordered by their matching term or name.
+        """
+        prefix = normalise_name(prefix)
+        keys = self._keys
+        results: dict[str, None] = {}
+
+        i = bisect.bisect_left(keys, prefix)
+        while len(results) < limit and i < len(keys) and keys[i].startswith(prefix):
+            results.setdefault(self._terms[i], None)
+            i += 1
+
+        return list(results)
+
+
+class EvolutionGraph:
+    """A process-local graph of Pokemon evolutions.
+
+    Args:
+        edges (Iterable[Tuple[str, str]]): Pairs of Pokemon terms and the term they evolve into.
+    """
+
+    def __init__(self, edges: Iterable[tuple[str, str]]) -> None:
+        self._evolutions: dict[str, list[str]] = defaultdict(list)
+        self._pre_evolutions: dict[str, list[str]] = defaultdict(list)
+
+        for term, evolution in edges:
+            self._evolutions[term].append(evolution)
+            self._pre_evolutions[evolution].append(term)
+
+    def evolutions(self, term: str) -> list[str]:
+        """Returns the terms a Pokemon evolves into."""
+        return self._evolutions.get(term, [])
+
+    def pre_evolutions(self, term: str) -> list[str]:
+        """Returns the terms a Pokemon evolves from."""
+        return self._pre_evolutions.get(term, [])
+
+    def family(self, term: str) -> list[str]:
+        """Returns every term in a Pokemon's evolution family.
+
+        Evolutions are followed in both directions, with each term visited only once,
+        so cyclic or self-referencing evolutions are handled.
+
+        Args:
+            term (str): The term of the Pokemon.
+        Returns:
+            List[str]: The terms in the family, starting with the given term.
+        """
+        seen = {term: None}
+        queue = [term]
+
+        for current in queue:
+            for neighbour in (*self.pre_evolutions(current), *self.evolutions(current)):
+                if neighbour not in seen:
+                    seen[neighbour] = None
+                    queue.append(neighbour)
+
+        return list(seen)
+
+
+async def _build_index(connection: Executor, /, table: type[Table]) -> TermIndex:
+    records = await fetch(connection, f"SELECT term FROM {table._name}")
+    index = _INDEXES[table] = TermIndex(record["term"] for record in records)
+    return index
+
+
+async def get_index(connection: Executor, /, table: type[Table]) -> TermIndex:
+    """Returns the :class:`TermIndex` for a table, building it on first use.
+
+    Args:
+        table (Type[Table]): The table to retrieve the index for.
+    Returns:
+        TermIndex: The table's term index.
+    """
+    index = _INDEXES.get(table)
+    if index is None:
+        index = await _build_index(connection, table)
+    return index
+
+
+async def _fetch_names(connection: Executor, /, table: type[Table]) -> list[tuple[str, tuple[str | None, ...]]]:
+    if table is tables.Pokemon:
+        records = await fetch(
+            connection,
+            f"""
+            SELECT pokemon.term, names.english, names.japanese, names.kana
+            FROM {tables.Pokemon._name} AS pokemon
+            LEFT JOIN {tables.PokemonNames._name} AS names ON names.term = pokemon.term
+            """,
+        )
+    else:
+        records = await fetch(connection, f"SELECT term, name FROM {table._name}")
+
+    return [(record[0], tuple(record)[1:]) for record in records]
+
+
+async def _build_name_index(connection: Executor, /) -> NameIndex:
+    global _NAME_INDEX
+    index = _NAME_INDEX = NameIndex(await _fetch_names(connection, tables.Pokemon))
+    return index
+
+
+async def get_name_index(connection: Executor, /) -> NameIndex:
+    """Returns the :class:`NameIndex` of Pokemon names, building it on first use."""
+    index = _NAME_INDEX
+    if index is None:
+        index = await _build_name_index(connection)
+    return index
+
+
+async def _build_prefix_index(connection: Executor, /, table: type[Table]) -> PrefixIndex:
+    index = _PREFIX_INDEXES[table] = PrefixIndex(await _fetch_names(connection, table))
+    return index
+
+
+async def get_prefix_index(connection: Executor, /, table: type[Table]) -> PrefixIndex:
+    """Returns the :class:`PrefixIndex` for a table, building it on first use.
+
+    Args:
+        table (Type[Table]): The table to retrieve the index for.
+    Returns:
+        PrefixIndex: The table's prefix index.
+    """
+    index = _PREFIX_INDEXES.get(table)
+    if index is None:
+        index = await _build_prefix_index(connection, table)
+    return index
+
+
+async def _build_evolution_graph(connection: Executor, /) -> EvolutionGraph:
+    global _EVOLUTION_GRAPH
+    records = await fetch(connection, f"SELECT term, evolution FROM {tables.PokemonEvolutions._name}")
+    graph = _EVOLUTION_GRAPH = EvolutionGraph((record["term"], record["evolution"]) for record in records)
+    return graph
+
+
+async def get_evolution_graph(connection: Executor, /) -> EvolutionGraph:
+    """Returns the :class:`EvolutionGraph`, building it on first use."""
+    graph = _EVOLUTION_GRAPH
+    if graph is None:
+        graph = await _build_evolution_graph(connection)
+    return graph
+
+
+async def rebuild_indexes(connection: Executor, /, *tables: type[Table]) -> None:
+    """Rebuilds the term, name and prefix indexes and the evolution graph from the database.
+
+    This should be called whenever the underlying data changes.
+
+    Args:
+        *tables (Type[Table]): The tables to rebuild, defaults to all searchable tables.
+    """
+    # Indexes are built concurrently if a pool was given
+    await gather(
+        connection,
+        *(_build_index(connection, table) for table in tables or SEARCHABLE_TABLES),
+        *(_build_prefix_index(connection, table) for table in tables or SEARCHABLE_TABLES),
+        _build_name_index(connection),
+        _build_evolution_graph(connection),
+    )
+
+
+def clear_indexes() -> None:
+    """Discards all indexes and the evolution graph, they will be rebuilt on next use."""
+    global _NAME_INDEX, _EVOLUTION_GRAPH
+    _INDEXES.clear()
+    _PREFIX_INDEXES.clear()
+    _NAME_INDEX = None
+    _EVOLUTION_GRAPH = None
+
+
+def set_pg_trgm(enabled: bool = True) -> None:
+    """Sets whether fuzzy matching is performed by the database using ``pg_trgm``.
+
+    When enabled searches are resolved with a single indexed similarity query,
+    rather than against the in-memory term indexes.
+    See :func:`create_trigram_indexes` for creating the required indexes.
+
+    Trigram similarity is not the same measure as the ``difflib`` ratio used in memory, so the two may
+    choose different matches. Terms match when their similarity is at least ``pg_trgm.similarity_threshold``,
+    ``0.3`` by default, which accepts looser matches than the in-memory cut-off of ``0.6``.
+
+    Args:
+        enabled (bool): Whether to enable database-side matching.
+    """
+    global _USE_PG_TRGM
+    _USE_PG_TRGM = enabled
+
+
+def pg_trgm_enabled() -> bool:
+    """Returns whether fuzzy matching is performed by the database."""
+    return _USE_PG_TRGM
+
+
+async def create_trigram_indexes(connection: Executor, /) -> None:
+    """Creates the ``pg_trgm`` extension and a trigram index on each searchable ``term`` column."""
+    await connection.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for table in SEARCHABLE_TABLES:
+        await connection.execute(
+            f"CREATE INDEX IF NOT EXISTS {table._local_name}_term_trgm_idx ON {table._name} USING gin (term gin_trgm_ops)"
+        )
@@ -0,0 +1,321 @@
+import bisect
+import logging
+import time
+from collections import Counter
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import wraps
+from inspect import isasyncgenfunction
+from typing import Any, TypeVar
+
+import asyncpg
+
+from . import statements
+from .concurrency import Connection, Executor, acquire
+
+__all__ = (
+    "Statement",
+    "Trace",
+    "Histogram",
+    "Metrics",
+    "add_hook",
+    "remove_hook",
+    "instrument",
+)
+
+log = logging.getLogger(__name__)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Upper bounds in seconds, the last bucket counts everything
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, float("inf"))
+
+
+@dataclass(slots=True)
+class Statement:
+    """A SQL statement executed during a public call."""
+
+    query: str
+    duration: float
+    rows: int
+
+
+@dataclass(slots=True)
+class Trace:
+    """The SQL statements and Python time spent in a single public call.
+
+    Attributes:
+        call (str): The name of the public function, e.g. ``"search.pokemon"``.
+        statements (List[Statement]): Every statement executed, in order.
+        phases (Dict[str, float]): Seconds spent in Python, by phase, ``"matching"`` or ``"hydration"``.
+        duration (float): The total seconds spent in the call.
+        failed (bool): Whether the call raised an exception.
+    """
+
+    call: str
+    statements: list[Statement] = field(default_factory=list)
+    phases: dict[str, float] = field(default_factory=dict)
+    duration: float = 0.0
+    failed: bool = False
+
+    @property
+    def sql_duration(self) -> float:
+        """The total seconds spent waiting on the database."""
+        return sum(statement.duration for statement in self.statements)
+
+    @property
+    def rows(self) -> int:
+        """The total number of rows transferred."""
+        return sum(statement.rows for statement in self.statements)
+
+
+class Histogram:
+    """A cumulative histogram of durations, compatible with Prometheus style buckets.
+
+    Args:
+        buckets (Sequence[float]): The upper bound of each bucket, in increasing order.
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        """Records a single value."""
+        self.counts[min(bisect.bisect_left(self.buckets, value), len(self.buckets) - 1)] += 1
+        self.sum += value
+        self.count += 1
+
+    def export(self) -> dict[str, Any]:
+        cumulative, total = {}, 0
+        for bound, count in zip(self.buckets, self.counts):
+            total += count
+            cumulative["+Inf" if bound == float("inf") else str(bound)] = total
+        return {"buckets": cumulative, "sum": self.sum, "count": self.count}
+
+
+class Metrics:
+    """Aggregates traces into counters and histograms for a metrics exporter.
+
+    Register :meth:`record` as a hook to aggregate every public call::
+
+        metrics = Metrics()
+        add_hook(metrics.record)
+        ...
+        metrics.export()
+
+    Args:
+        buckets (Sequence[float]): The upper bound of each histogram bucket, in seconds.
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        self.buckets = buckets
+        self.calls: Counter[str] = Counter()
+        self.errors: Counter[str] = Counter()
+        self.statements: Counter[str] = Counter()
+        self.rows: Counter[str] = Counter()
+        self.durations: dict[str, Histogram] = {}
+        self.sql_durations: dict[str, Histogram] = {}
+        self.phases: dict[str, Counter[str]] = {}
+
+    def _histogram(self, histograms: dict[str, Histogram], call: str) -> Histogram:
+        if call not in histograms:
+            histograms[call] = Histogram(self.buckets)
+        return histograms[call]
+
+    def record(self, trace: Trace) -> None:
+        """Adds a trace to the metrics."""
+        self.calls[trace.call] += 1
+        self.errors[trace.call] += trace.failed
+        self.statements[trace.call] += len(trace.statements)
+        self.rows[trace.call] += trace.rows
+        self._histogram(self.durations, trace.call).observe(trace.duration)
+        self._histogram(self.sql_durations, trace.call).observe(trace.sql_duration)
+        self.phases.setdefault(trace.call, Counter()).update(trace.phases)
+
+    def export(self) -> dict[str, Any]:
+        """Returns the metrics as plain dictionaries, keyed by metric and then by call."""
+        return {
+            "calls_total": dict(self.calls),
+            "errors_total": dict(self.errors),
+            "statements_total": dict(self.statements),
+            "rows_total": dict(self.rows),
+            "duration_seconds": {call: histogram.export() for call, histogram in self.durations.items()},
+            "sql_duration_seconds": {call: histogram.export() for call, histogram in self.sql_durations.items()},
+            "python_seconds": {call: dict(phases) for call, phases in self.phases.items()},
+        }
+
+
+_HOOKS: list[Callable[[Trace], None]] = []
+_COLLECTORS: ContextVar[tuple[list[Trace], ...]] = ContextVar("ampharos_collectors", default=())
+_TRACE: ContextVar[Trace | None] = ContextVar("ampharos_trace", default=None)
+
+
+def add_hook(hook: Callable[[Trace], None]) -> None:
+    """Registers a function to be called with the :class:`Trace` of every public call.
+
+    Hooks are called synchronously once a call completes, and should not block.
+    Exceptions raised by a hook are logged rather than propagated to the caller.
+    """
+    _HOOKS.append(hook)
+
+
+def remove_hook(hook: Callable[[Trace], None]) -> None:
+    """Unregisters a function added with :func:`add_hook`."""
+    _HOOKS.remove(hook)
+
+
+@contextmanager
+def instrument() -> Iterator[list[Trace]]:
+    """Collects the :class:`Trace` of every public call made within the context.
+
+    Only calls made from the current task, or tasks it creates, are collected::
+
+        with instrument() as traces:
+            await ampharos.pokemon(connection, "pikachu")
+
+        for statement in traces[0].statements:
+            print(statement.query, statement.duration, statement.rows)
+    """
+    traces: list[Trace] = []
+    token = _COLLECTORS.set((*_COLLECTORS.get(), traces))
+    try:
+        yield traces
+    finally:
+        _COLLECTORS.reset(token)
+
+
+def _start(func: Callable[..., Any]) -> Trace | None:
+    # Calls made from within another public call are recorded as part of it
+    if _TRACE.get() is not None or not (_HOOKS or _COLLECTORS.get()):
+        return None
+    return Trace(f"{func.__module__.rpartition('.')[2]}.{func.__name__}")
+
+
+def _finish(trace: Trace) -> None:
+    for traces in _COLLECTORS.get():
+        traces.append(trace)
+    # A failing hook must not replace the result of the call it traced
+    for hook in _HOOKS:
+        try:
+            hook(trace)
+        except Exception:
+            log.exception("Instrumentation hook %r raised an exception", hook)
+
+
+def traced(func: F) -> F:
+    """Records a :class:`Trace` of each call to a public coroutine or async generator function."""
+    if isasyncgenfunction(func):
+
+        @wraps(func)
+        async def generator(*args: Any, **kwargs: Any) -> AsyncIterator[Any]:
+            trace = _start(func)
+            if trace is None:
+                async for item in func(*args, **kwargs):
+                    yield item
+                return
+
+            # Only time spent producing items is recorded, the trace is not active while the caller iterates
+            iterator = func(*args, **kwargs)
+            try:
+                while True:
+                    token = _TRACE.set(trace)
+                    start = time.perf_counter()
+                    try:
+                        item = await iterator.__anext__()
+                    except StopAsyncIteration:
+                        break
+                    except BaseException:
+                        trace.failed = True
+                        raise
+                    finally:
+                        trace.duration += time.perf_counter() - start
+                        _TRACE.reset(token)
+                    yield item
+            finally:
+                await iterator.aclose()
+                _finish(trace)
+
+        return generator  # type: ignore
+
+    @wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        trace = _start(func)
+        if trace is None:
+            return await func(*args, **kwargs)
+
+        token = _TRACE.set(trace)
+        start = time.perf_counter()
+        try:
+            return await func(*args, **kwargs)
+        except BaseException:
+            trace.failed = True
+            raise
+        finally:
+            trace.duration = time.perf_counter() - start
+            _TRACE.reset(token)
+            _finish(trace)
+
+    return wrapper  # type: ignore
+
+
+@contextmanager
+def timed(phase: str) -> Iterator[None]:
+    """Records the time spent in a block of Python code against the current trace."""
+    trace = _TRACE.get()
+    if trace is None:
+        yield
+        return
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        trace.phases[phase] = trace.phases.get(phase, 0.0) + time.perf_counter() - start
+
+
+def record_statement(query: str, start: float, rows: int) -> None:
+    """Records a statement which started at ``start`` against the current trace."""
+    trace = _TRACE.get()
+    if trace is not None:
+        trace.statements.append(Statement(query, time.perf_counter() - start, rows))
+
+
+async def fetch(connection: Executor, query: str, *args: Any, prepared: bool = False) -> list[asyncpg.Record]:
+    """Runs a query and returns all of its rows, recording it against the current trace.
+
+    Hot queries should set ``prepared`` to run as a prepared statement, see :mod:`statements`.
+    """
+    async with acquire(connection) as connection:
+        if _TRACE.get() is None:
+            return await _run(connection, "fetch", query, args, prepared)
+
+        start = time.perf_counter()
+        records = await _run(connection, "fetch", query, args, prepared)
+        record_statement(query, start, len(records))
+        return records
+
+
+async def fetchrow(connection: Executor, query: str, *args: Any, prepared: bool = False) -> asyncpg.Record | None:
+    """Runs a query and returns its first row, recording it against the current trace.
+
+    Hot queries should set ``prepared`` to run as a prepared statement, see :mod:`statements`.
+    """
+    async with acquire(connection) as connection:
+        if _TRACE.get() is None:
+            return await _run(connection, "fetchrow", query, args, prepared)
+
+        start = time.perf_counter()
+        record = await _run(connection, "fetchrow", query, args, prepared)
+        record_statement(query, start, record is not None)
+        return record
+
+
+def _run(connection: Connection, method: str, query: str, args: tuple[Any, ...], prepared: bool) -> Awaitable[Any]:
+    if prepared:
+        return statements.run(connection, method, query, args)
+    return getattr(connection, method)(query, *args)
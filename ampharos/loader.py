@@ -0,0 +1,86 @@
+import logging
+from typing import Any, cast
+
+from donphan import Table
+
+from .snapshot import load_records
+from .tables import ALL_TABLES
+
+__all__ = (
+    "REFERENCED",
+    "sanitise_records",
+    "load_sanitised_records",
+)
+
+log = logging.getLogger(__name__)
+
+# Tables which are referenced by a foreign key, mapped to the referenced column
+REFERENCED: dict[type[Table], str] = {
+    cast(type[Table], column.references.table): column.references.name
+    for table in ALL_TABLES
+    for column in table._columns
+    if column.references is not None
+}
+
+
+def sanitise_records(
+    table: type[Table],
+    records: list[tuple[Any, ...]],
+    keys: dict[type[Table], set[Any]],
+) -> list[tuple[Any, ...]]:
+    """Drops or repairs rows which would violate a constraint of the table.
+
+    Args:
+        table (Type[Table]): The table the rows are for.
+        records (List[Tuple[Any, ...]]): The rows, in column order.
+        keys (Dict[Type[Table], Set[Any]]): The referenced keys of each table in :data:`REFERENCED`.
+    Returns:
+        List[Tuple[Any, ...]]: The rows which can be loaded.
+    """
+    columns = list(table._columns)
+    primary_key = [i for i, column in enumerate(columns) if column.primary_key]
+    seen: set[tuple[Any, ...]] = set()
+    sanitised: list[tuple[Any, ...]] = []
+
+    for record in records:
+        row = list(record)
+
+        for i, column in enumerate(columns):
+            references = column.references
+            if references is None or row[i] is None or row[i] in keys[cast(type[Table], references.table)]:
+                continue
+
+            if column.nullable and not column.primary_key:
+                row[i] = None
+            else:
+                break
+        else:
+            if any(row[i] is None for i, column in enumerate(columns) if column.primary_key or not column.nullable):
+                continue
+
+            key = tuple(row[i] for i in primary_key)
+            if key not in seen:
+                seen.add(key)
+                sanitised.append(tuple(row))
+
+    if len(sanitised) != len(records):
+        log.warning("Skipped %d invalid or duplicate rows in %s.json", len(records) - len(sanitised), table.__name__.lower())
+
+    return sanitised
+
+
+def load_sanitised_records() -> dict[type[Table], list[tuple[Any, ...]]]:
+    """Loads the rows of every table, as they would be loaded into the database.
+
+    Rows which would violate a constraint are dropped or repaired, see :func:`sanitise_records`.
+    """
+    keys: dict[type[Table], set[Any]] = {}
+    records: dict[type[Table], list[tuple[Any, ...]]] = {}
+
+    for table in ALL_TABLES:
+        rows = records[table] = sanitise_records(table, load_records(table), keys)
+        if table in REFERENCED:
+            index = [column.name for column in table._columns].index(REFERENCED[table])
+            keys[table] = {row[index] for row in rows}
+
+    return records
@@ -0,0 +1,364 @@
+import random
+from collections.abc import Iterator
+from typing import Any, overload
+
+from donphan import Table
+
+from . import tables, types
+from .effectiveness import TypeIndex
+from .index import EvolutionGraph, NameIndex, PrefixIndex, TermIndex, check_searchable, parse_dex_no
+from .loader import load_sanitised_records
+from .stats import STATS, StatMatrix
+
+__all__ = (
+    "load",
+    "ability",
+    "item",
+    "move",
+    "pokemon",
+    "ability_many",
+    "item_many",
+    "move_many",
+    "pokemon_many",
+    "autocomplete",
+    "stat_matrix",
+    "type_index",
+    "all_abilities",
+    "all_items",
+    "all_moves",
+    "all_pokemon",
+    "random_ability",
+    "random_item",
+    "random_move",
+    "random_pokemon",
+)
+
+
+def _by_term(rows: list[tuple[Any, ...]]) -> dict[str, tuple[Any, ...]]:
+    return {row[0]: row for row in rows}
+
+
+class _Database:
+    def __init__(self) -> None:
+        # Rows are sanitised as they are when loaded into the database, so both backends hold the same data
+        records = load_sanitised_records()
+
+        # Rows are in column order, which matches the field order of the corresponding types
+        self.abilities: dict[str, types.Ability] = {
+            term: types.Ability(*row) for term, row in _by_term(records[tables.Abilities]).items()
+        }
+        self.items: dict[str, types.Item] = {term: types.Item(*row) for term, row in _by_term(records[tables.Items]).items()}
+        self.moves: dict[str, types.Move] = {term: types.Move(*row) for term, row in _by_term(records[tables.Moves]).items()}
+
+        names = _by_term(records[tables.PokemonNames])
+        dex_entries = _by_term(records[tables.PokemonDexEntries])
+        base_stats = _by_term(records[tables.PokemonBaseStats])
+        typings = _by_term(records[tables.PokemonTypes])
+        abilities = _by_term(records[tables.PokemonAbilities])
+
+        self.pokemon: dict[str, types.Pokemon] = {}
+        self.dex_numbers: dict[int, str] = {}
+
+        for term, (_, dex_no, classification) in _by_term(records[tables.Pokemon]).items():
+            name = names.get(term)
+            dex_entry = dex_entries.get(term)
+            stats = base_stats.get(term)
+            typing = typings.get(term)
+            ability = abilities.get(term)
+
+            self.dex_numbers.setdefault(dex_no, term)
+            self.pokemon[term] = types.Pokemon(
+                term,
+                pokedex_number=dex_no,
+                classification=classification,
+                name=types.PokemonName(*name) if name else None,  # type: ignore
+                pokedex_entries=types.PokemonPokedexEntries(*dex_entry) if dex_entry else None,
+                evolutions=[],
+                base_stats=types.PokemonBaseStats(*stats) if stats else None,
+                typing=types.PokemonTypings(*typing) if typing else None,
+                abilities=(
+                    types.PokemonAbilities(term, *(self.abilities.get(slot) for slot in ability[1:])) if ability else None
+                ),
+            )
+
+        self.evolutions = EvolutionGraph((term, evolution) for term, evolution in records[tables.PokemonEvolutions])
+        for term, pokemon in self.pokemon.items():
+            pokemon.evolutions.extend(
+                self.pokemon[evolution] for evolution in dict.fromkeys(self.evolutions.evolutions(term))
+            )
+            pokemon.pre_evolutions.extend(
+                self.pokemon[pre_evolution] for pre_evolution in dict.fromkeys(self.evolutions.pre_evolutions(term))
+            )
+
+        self.names = NameIndex((term, names[term][1:] if term in names else ()) for term in self.pokemon)
+
+        self.indexes: dict[str, TermIndex] = {
+            "abilities": TermIndex(self.abilities),
+            "items": TermIndex(self.items),
+            "moves": TermIndex(self.moves),
+            "pokemon": TermIndex(self.pokemon),
+        }
+        self.prefixes: dict[str, PrefixIndex] = {
+            "abilities": PrefixIndex((term, (ability.name,)) for term, ability in self.abilities.items()),
+            "items": PrefixIndex((term, (item.name,)) for term, item in self.items.items()),
+            "moves": PrefixIndex((term, (move.name,)) for term, move in self.moves.items()),
+            "pokemon": PrefixIndex((term, names[term][1:] if term in names else ()) for term in self.pokemon),
+        }
+
+        # Built on first use, as numpy is an optional dependency
+        self.stat_matrix: StatMatrix | None = None
+        self.type_index: TypeIndex | None = None
+
+    def search(self, table: str, search_term: str) -> str | None:
+        matches = self.indexes[table].get_close_matches(search_term, 1)
+        return matches[0] if matches else None
+
+
+_DATABASE: _Database | None = None
+
+
+def _database() -> _Database:
+    global _DATABASE
+    if _DATABASE is None:
+        _DATABASE = _Database()
+    return _DATABASE
+
+
+def load() -> None:
+    """Loads the bundled Pokemon data into memory.
+
+    This is done automatically on first use, but may be called ahead of time to avoid the delay.
+    """
+    global _DATABASE
+    _DATABASE = _Database()
+
+
+def ability(search_term: str) -> types.Ability | None:
+    """Searches for a :class:`types.Ability`.
+
+    Args:
+        search_term (str): The term to search for
+    Returns:
+        types.Ability: The best matching ability.
+    """
+    database = _database()
+    term = database.search("abilities", search_term)
+    return database.abilities[term] if term is not None else None
+
+
+def item(search_term: str) -> types.Item | None:
+    """Searches for a :class:`types.Item`.
+
+    Args:
+        search_term (str): The term to search for
+    Returns:
+        types.Item: The best matching item.
+    """
+    database = _database()
+    term = database.search("items", search_term)
+    return database.items[term] if term is not None else None
+
+
+def move(search_term: str) -> types.Move | None:
+    """Searches for a :class:`types.Move`.
+
+    Args:
+        search_term (str): The term to search for
+    Returns:
+        types.Move: The best matching move.
+    """
+    database = _database()
+    term = database.search("moves", search_term)
+    return database.moves[term] if term is not None else None
+
+
+def pokemon(search_term: str) -> types.Pokemon | None:
+    """Searches for a :class:`types.Pokemon`.
+
+    Args:
+        search_term (str): The term, English, Romaji or Kana name, or Pokedex number to search for
+    Returns:
+        types.Pokemon: The best matching Pokemon.
+    """
+    database = _database()
+    if search_term.isdecimal():
+        dex_no = parse_dex_no(search_term)
+        term = database.dex_numbers.get(dex_no) if dex_no is not None else None
+    else:
+        term = database.names.resolve(search_term) or database.search("pokemon", search_term)
+    return database.pokemon[term] if term is not None else None
+
+
+def ability_many(search_terms: list[str]) -> list[types.Ability | None]:
+    """Searches for multiple :class:`types.Ability` at once."""
+    return [ability(search_term) for search_term in search_terms]
+
+
+def item_many(search_terms: list[str]) -> list[types.Item | None]:
+    """Searches for multiple :class:`types.Item` at once."""
+    return [item(search_term) for search_term in search_terms]
+
+
+def move_many(search_terms: list[str]) -> list[types.Move | None]:
+    """Searches for multiple :class:`types.Move` at once."""
+    return [move(search_term) for search_term in search_terms]
+
+
+def pokemon_many(search_terms: list[str]) -> list[types.Pokemon | None]:
+    """Searches for multiple :class:`types.Pokemon` at once."""
+    return [pokemon(search_term) for search_term in search_terms]
+
+
+def autocomplete(table: type[Table], prefix: str, limit: int = 25) -> list[str]:
+    """Returns the terms in a table which start with a prefix, for autocompletion.
+
+    Args:
+        table (Type[Table]): The table to complete, one of :class:`tables.Abilities`,
+            :class:`tables.Items`, :class:`tables.Moves` or :class:`tables.Pokemon`.
+        prefix (str): The prefix to complete.
+        limit (int): The maximum number of terms to return.
+    Returns:
+        List[str]: The matching terms.
+    Raises:
+        ValueError: The table cannot be autocompleted.
+    """
+    check_searchable(table)
+    return _database().prefixes[table.__name__.lower()].complete(prefix, limit)
+
+
+def stat_matrix() -> StatMatrix:
+    """Returns a :class:`stats.StatMatrix` of every Pokemon's base stats.
+
+    Raises:
+        ImportError: numpy is not installed.
+    """
+    database = _database()
+    if database.stat_matrix is None:
+        base_stats = {term: pokemon.base_stats for term, pokemon in database.pokemon.items() if pokemon.base_stats}
+        database.stat_matrix = StatMatrix(
+            list(base_stats), ([getattr(stats, stat) for stat in STATS] for stats in base_stats.values())
+        )
+    return database.stat_matrix
+
+
+def type_index() -> TypeIndex:
+    """Returns a :class:`effectiveness.TypeIndex` of every Pokemon's defensive type matchups."""
+    database = _database()
+    if database.type_index is None:
+        database.type_index = TypeIndex(
+            (term, pokemon.typing.primary, pokemon.typing.secondary)
+            for term, pokemon in database.pokemon.items()
+            if pokemon.typing is not None
+        )
+    return database.type_index
+
+
+def all_abilities() -> Iterator[types.Ability]:
+    """Returns an :class:`Iterator` of all :class:`types.Ability`."""
+    return iter(_database().abilities.values())
+
+
+def all_items() -> Iterator[types.Item]:
+    """Returns an :class:`Iterator` of all :class:`types.Item`."""
+    return iter(_database().items.values())
+
+
+def all_moves() -> Iterator[types.Move]:
+    """Returns an :class:`Iterator` of all :class:`types.Move`."""
+    return iter(_database().moves.values())
+
+
+def all_pokemon() -> Iterator[types.Pokemon]:
+    """Returns an :class:`Iterator` of all :class:`types.Pokemon`."""
+    return iter(_database().pokemon.values())
+
+
+def _random(table: str, k: int | None) -> list[str] | str:
+    terms = _database().indexes[table].terms
+    if k is not None and not 0 <= k <= len(terms):
+        raise ValueError(f"Cannot choose {k} from {table}, expected between 0 and {len(terms)}")
+    return random.sample(terms, k) if k is not None else random.choice(terms)
+
+
+@overload
+def random_ability() -> types.Ability: ...
+
+
+@overload
+def random_ability(k: int) -> list[types.Ability]: ...
+
+
+def random_ability(k: int | None = None) -> types.Ability | list[types.Ability]:
+    """Returns a random :class:`types.Ability`.
+
+    Args:
+        k (int): If provided, returns a list of this many distinct abilities instead.
+    Raises:
+        ValueError: There are fewer than ``k`` abilities.
+    """
+    terms = _random("abilities", k)
+    abilities = _database().abilities
+    return [abilities[term] for term in terms] if isinstance(terms, list) else abilities[terms]
+
+
+@overload
+def random_item() -> types.Item: ...
+
+
+@overload
+def random_item(k: int) -> list[types.Item]: ...
+
+
+def random_item(k: int | None = None) -> types.Item | list[types.Item]:
+    """Returns a random :class:`types.Item`.
+
+    Args:
+        k (int): If provided, returns a list of this many distinct items instead.
+    Raises:
+        ValueError: There are fewer than ``k`` items.
+    """
+    terms = _random("items", k)
+    items = _database().items
+    return [items[term] for term in terms] if isinstance(terms, list) else items[terms]
+
+
+@overload
+def random_move() -> types.Move: ...
+
+
+@overload
+def random_move(k: int) -> list[types.Move]: ...
+
+
+def random_move(k: int | None = None) -> types.Move | list[types.Move]:
+    """Returns a random :class:`types.Move`.
+
+    Args:
+        k (int): If provided, returns a list of this many distinct moves instead.
+    Raises:
+        ValueError: There are fewer than ``k`` moves.
+    """
+    terms = _random("moves", k)
+    moves = _database().moves
+    return [moves[term] for term in terms] if isinstance(terms, list) else moves[terms]
+
+
+@overload
+def random_pokemon() -> types.Pokemon: ...
+
+
+@overload
+def random_pokemon(k: int) -> list[types.Pokemon]: ...
+
+
+def random_pokemon(k: int | None = None) -> types.Pokemon | list[types.Pokemon]:
+    """Returns a random :class:`types.Pokemon`.
+
+    Args:
+        k (int): If provided, returns a list of this many distinct Pokemon instead.
+    Raises:
+        ValueError: There are fewer than ``k`` Pokemon.
+    """
+    terms = _random("pokemon", k)
+    pokemon = _database().pokemon
+    return [pokemon[term] for term in terms] if isinstance(terms, list) else pokemon[terms]
@@ -0,0 +1,228 @@
+from collections.abc import Iterable
+from enum import Enum
+from typing import Any
+
+from . import tables, types
+from .concurrency import Executor
+from .instrumentation import fetch, traced
+from .search import _hydrate_pokemon, _move
+from .stats import STATS
+from .tables import Category, Typing
+
+__all__ = (
+    "GENERATIONS",
+    "STATS",
+    "find_pokemon",
+    "find_moves",
+)
+
+# Inclusive bounds, either may be None for an open-ended range
+Range = tuple[int | None, int | None]
+
+# The range of Pokedex numbers introduced in each generation
+GENERATIONS: dict[int, tuple[int, int]] = {
+    1: (1, 151),
+    2: (152, 251),
+    3: (252, 386),
+    4: (387, 493),
+    5: (494, 649),
+    6: (650, 721),
+    7: (722, 809),
+    8: (810, 905),
+    9: (906, 1025),
+}
+
+_TOTAL = "(" + " + ".join(f"base_stats.{stat}" for stat in STATS) + ")"
+
+_POKEMON_ORDERS = {
+    "dex_no": "pokemon.dex_no",
+    "term": "pokemon.term",
+    "total": _TOTAL,
+    **{stat: f"base_stats.{stat}" for stat in STATS},
+}
+
+_MOVE_ORDERS = {column: column for column in ("term", "name", "pp", "power", "accuracy")}
+
+
+class _Query:
+    def __init__(self) -> None:
+        self.conditions: list[str] = []
+        self.args: list[Any] = []
+
+    def param(self, value: Any) -> str:
+        self.args.append(value)
+        return f"${len(self.args)}"
+
+    def enum(self, column: Any, value: Any) -> str:
+        # Enums are passed by name, as the enum codecs may not be registered on the connection
+        return f"{self.param(value.name)}::text::{column.sql_type.sql_type}"
+
+    def range(self, expression: str, bounds: Range | None) -> None:
+        if bounds is None:
+            return
+        minimum, maximum = bounds
+        if minimum is not None:
+            self.conditions.append(f"{expression} >= {self.param(minimum)}")
+        if maximum is not None:
+            self.conditions.append(f"{expression} <= {self.param(maximum)}")
+
+    def where(self) -> str:
+        return f"WHERE {' AND '.join(self.conditions)}" if self.conditions else ""
+
+    def order(self, orders: dict[str, str], order_by: str, descending: bool, tiebreak: str) -> str:
+        if order_by not in orders:
+            raise ValueError(f"Cannot order by {order_by!r}, expected one of {', '.join(orders)}")
+        return f"ORDER BY {orders[order_by]} {'DESC' if descending else 'ASC'} NULLS LAST, {tiebreak}"
+
+    def limit(self, limit: int | None) -> str:
+        return f"LIMIT {self.param(limit)}" if limit is not None else ""
+
+
+def _enums(value: Any | Iterable[Any] | None, enum: type[Enum]) -> list[Any]:
+    if value is None:
+        return []
+    # Strings are iterable, so are converted by name before they would be split into characters
+    if isinstance(value, (str, enum)):
+        value = [value]
+
+    members = []
+    for member in value:
+        if isinstance(member, str):
+            if member.upper() not in enum.__members__:
+                raise ValueError(f"Unknown {enum.__name__} {member!r}, expected one of {', '.join(enum.__members__)}")
+            member = enum[member.upper()]
+        members.append(member)
+    return members
+
+
+@traced
+async def find_pokemon(
+    connection: Executor,
+    /,
+    *,
+    typing: Typing | str | Iterable[Typing | str] | None = None,
+    generation: int | None = None,
+    hp: Range | None = None,
+    attack: Range | None = None,
+    defense: Range | None = None,
+    special_attack: Range | None = None,
+    special_defense: Range | None = None,
+    speed: Range | None = None,
+    total: Range | None = None,
+    order_by: str = "dex_no",
+    descending: bool = False,
+    limit: int | None = None,
+) -> list[types.Pokemon]:
+    """Finds every :class:`types.Pokemon` matching a set of filters.
+
+    Filters are compiled to a single SQL query, only the matching Pokemon are hydrated.
+    Stat ranges are inclusive tuples of ``(minimum, maximum)``, either bound may be ``None``.
+
+    Args:
+        typing (Union[types.Typing, str, Iterable[types.Typing]]): Types the Pokemon must have, all types must match.
+            Types may also be given by name.
+        generation (int): The generation the Pokemon was introduced in.
+        hp (Tuple[Optional[int], Optional[int]]): The range of the Pokemon's base HP.
+        attack (Tuple[Optional[int], Optional[int]]): The range of the Pokemon's base Attack.
+        defense (Tuple[Optional[int], Optional[int]]): The range of the Pokemon's base Defense.
+        special_attack (Tuple[Optional[int], Optional[int]]): The range of the Pokemon's base Special Attack.
+        special_defense (Tuple[Optional[int], Optional[int]]): The range of the Pokemon's base Special Defense.
+        speed (Tuple[Optional[int], Optional[int]]): The range of the Pokemon's base Speed.
+        total (Tuple[Optional[int], Optional[int]]): The range of the Pokemon's base stat total.
+        order_by (str): What to order the Pokemon by, ``"dex_no"``, ``"term"``, ``"total"`` or a stat.
+        descending (bool): Whether to order the Pokemon in descending order.
+        limit (int): The maximum number of Pokemon to return.
+    Returns:
+        List[types.Pokemon]: The matching Pokemon.
+    Raises:
+        ValueError: An unknown generation, type or ordering was given.
+    """
+    query = _Query()
+
+    for member in _enums(typing, Typing):
+        value = query.enum(tables.PokemonTypes.first, member)
+        query.conditions.append(f"(typing.first = {value} OR typing.second = {value})")
+
+    if generation is not None:
+        if generation not in GENERATIONS:
+            raise ValueError(f"Unknown generation {generation}")
+        query.range("pokemon.dex_no", GENERATIONS[generation])
+
+    stats = dict(zip(STATS, (hp, attack, defense, special_attack, special_defense, speed)))
+    for stat, bounds in stats.items():
+        query.range(f"base_stats.{stat}", bounds)
+    query.range(_TOTAL, total)
+
+    order = query.order(_POKEMON_ORDERS, order_by, descending, "pokemon.dex_no, pokemon.term")
+    records = await fetch(
+        connection,
+        f"""
+        SELECT pokemon.term
+        FROM {tables.Pokemon._name} AS pokemon
+        LEFT JOIN {tables.PokemonTypes._name} AS typing ON typing.term = pokemon.term
+        LEFT JOIN {tables.PokemonBaseStats._name} AS base_stats ON base_stats.term = pokemon.term
+        {query.where()}
+        {order}
+        {query.limit(limit)}
+        """,
+        *query.args,
+    )
+
+    terms = [record["term"] for record in records]
+    hydrated = await _hydrate_pokemon(connection, terms)
+    return [hydrated[term] for term in terms]
+
+
+@traced
+async def find_moves(
+    connection: Executor,
+    /,
+    *,
+    type: Typing | str | Iterable[Typing | str] | None = None,
+    category: Category | str | Iterable[Category | str] | None = None,
+    power: Range | None = None,
+    accuracy: Range | None = None,
+    pp: Range | None = None,
+    order_by: str = "term",
+    descending: bool = False,
+    limit: int | None = None,
+) -> list[types.Move]:
+    """Finds every :class:`types.Move` matching a set of filters.
+
+    Filters are compiled to a single SQL query. Ranges are inclusive tuples
+    of ``(minimum, maximum)``, either bound may be ``None``.
+
+    Args:
+        type (Union[types.Typing, str, Iterable[types.Typing]]): The move's type, any of the types may match.
+            Types may also be given by name.
+        category (Union[types.Category, str, Iterable[types.Category]]): The move's category, any of the categories may match.
+        power (Tuple[Optional[int], Optional[int]]): The range of the move's power.
+        accuracy (Tuple[Optional[int], Optional[int]]): The range of the move's accuracy.
+        pp (Tuple[Optional[int], Optional[int]]): The range of the move's PP.
+        order_by (str): What to order the moves by, ``"term"``, ``"name"``, ``"pp"``, ``"power"`` or ``"accuracy"``.
+        descending (bool): Whether to order the moves in descending order.
+        limit (int): The maximum number of moves to return.
+    Returns:
+        List[types.Move]: The matching moves.
+    Raises:
+        ValueError: An unknown type, category or ordering was given.
+    """
+    query = _Query()
+
+    for column, values in ((tables.Moves.type, _enums(type, Typing)), (tables.Moves.category, _enums(category, Category))):
+        if values:
+            matches = " OR ".join(f"{column.name} = {query.enum(column, value)}" for value in values)
+            query.conditions.append(f"({matches})")
+
+    query.range("power", power)
+    query.range("accuracy", accuracy)
+    query.range("pp", pp)
+
+    order = query.order(_MOVE_ORDERS, order_by, descending, "term")
+    records = await fetch(
+        connection,
+        f"SELECT * FROM {tables.Moves._name} {query.where()} {order} {query.limit(limit)}",
+        *query.args,
+    )
+
+    return [await _move(connection, record) for record in records]
@@ -1,18 +1,37 @@
-import difflib
+import json
 import random
+import time
 from collections.abc import AsyncIterator
-from typing import TypeVar
+from typing import overload
 
 import asyncpg
 from donphan import Table
 
 from . import tables, types
+from .cache import cached
+from .concurrency import Executor, acquire, gather
+from .index import (
+    check_searchable,
+    get_evolution_graph,
+    get_index,
+    get_name_index,
+    get_prefix_index,
+    parse_dex_no,
+    pg_trgm_enabled,
+)
+from .instrumentation import fetch, fetchrow, record_statement, timed, traced
+from .views import POKEMON_VIEW, pokemon_view_enabled
 
 __all__ = (
     "ability",
     "item",
     "move",
     "pokemon",
+    "ability_many",
+    "item_many",
+    "move_many",
+    "pokemon_many",
+    "autocomplete",
     "all_abilities",
     "all_items",
     "all_moves",
@@ -23,46 +42,87 @@ __all__ = (
     "random_pokemon",
 )
 
-T = TypeVar("T")
-
 
 async def _search(
-    connection: asyncpg.Connection,
+    connection: Executor,
     /,
     table: type[Table],
     search_term: str,
 ) -> asyncpg.Record | None:
-    records = await connection.fetch(f"SELECT term FROM {table._name}")
-    matches = difflib.get_close_matches(search_term, (record["term"] for record in records))
+    if pg_trgm_enabled():
+        return await fetchrow(
+            connection,
+            f"SELECT * FROM {table._name} WHERE term % $1 ORDER BY similarity(term, $1) DESC, term LIMIT 1",
+            search_term,
+            prepared=True,
+        )
+
+    index = await get_index(connection, table)
+    with timed("matching"):
+        matches = index.get_close_matches(search_term, 1)
 
     if not matches:
         return None
 
-    return await table.fetch_row(connection, term=matches[0])
+    return await fetchrow(connection, f"SELECT * FROM {table._name} WHERE term = $1", matches[0], prepared=True)
 
 
-async def _fetch(
-    connection: asyncpg.Connection,
+async def _resolve_many(
+    connection: Executor,
+    /,
+    table: type[Table],
+    search_terms: list[str],
+) -> list[str | None]:
+    if pg_trgm_enabled():
+        records = await fetch(
+            connection,
+            f"""
+            SELECT matches.term
+            FROM unnest($1::text[]) WITH ORDINALITY AS search_terms(search_term, i)
+            LEFT JOIN LATERAL (
+                SELECT term FROM {table._name}
+                WHERE term % search_terms.search_term
+                ORDER BY similarity(term, search_terms.search_term) DESC, term
+                LIMIT 1
+            ) AS matches ON true
+            ORDER BY search_terms.i
+            """,
+            search_terms,
+        )
+        return [record["term"] for record in records]
+
+    index = await get_index(connection, table)
+    with timed("matching"):
+        return [next(iter(index.get_close_matches(search_term, 1)), None) for search_term in search_terms]
+
+
+async def _search_many(
+    connection: Executor,
     /,
     table: type[Table],
-    term: str,
-    type: type[T],
-) -> T | None:
-    record = await table.fetch_row(connection, term=term)
-    if record is not None:
-        return type(*record.values())
+    search_terms: list[str],
+) -> list[asyncpg.Record | None]:
+    terms = await _resolve_many(connection, table, search_terms)
+
+    records = await fetch(
+        connection, f"SELECT * FROM {table._name} WHERE term = ANY($1::text[])", list(filter(None, terms)), prepared=True
+    )
+    by_term = {record["term"]: record for record in records}
+    return [by_term.get(term) if term is not None else None for term in terms]
 
 
 async def _ability(
-    connection: asyncpg.Connection,
+    connection: Executor,
     /,
     record: asyncpg.Record,
 ) -> types.Ability:
-    return types.Ability(*record.values())
+    return types.intern(types.Ability(*record.values()))
 
 
+@traced
+@cached(tables.Abilities)
 async def ability(
-    connection: asyncpg.Connection,
+    connection: Executor,
     /,
     search_term: str,
 ) -> types.Ability | None:
@@ -81,16 +141,35 @@ async def ability(
     return await _ability(connection, record)
 
 
+@traced
+async def ability_many(
+    connection: Executor,
+    /,
+    search_terms: list[str],
+) -> list[types.Ability | None]:
+    """Searches for multiple :class:`types.Ability` at once.
+
+    Args:
+        search_terms (List[str]): The terms to search for
+    Returns:
+        List[Optional[types.Ability]]: The best matching abilities, in the same order as the search terms.
+    """
+    records = await _search_many(connection, tables.Abilities, search_terms)
+    return [await _ability(connection, record) if record is not None else None for record in records]
+
+
 async def _item(
-    connection: asyncpg.Connection,
+    connection: Executor,
     /,
     record: asyncpg.Record,
 ) -> types.Item:
     return types.Item(*record.values())
 
 
+@traced
+@cached(tables.Items)
 async def item(
-    connection: asyncpg.Connection,
+    connection: Executor,
     /,
     search_term: str,
 ) -> types.Item | None:
@@ -108,16 +187,35 @@ async def item(
     return await _item(connection, record)
 
 
+@traced
+async def item_many(
+    connection: Executor,
+    /,
+    search_terms: list[str],
+) -> list[types.Item | None]:
+    """Searches for multiple :class:`types.Item` at once.
+
+    Args:
+        search_terms (List[str]): The terms to search for
+    Returns:
+        List[Optional[types.Item]]: The best matching items, in the same order as the search terms.
+    """
+    records = await _search_many(connection, tables.Items, search_terms)
+    return [await _item(connection, record) if record is not None else None for record in records]
+
+
 async def _move(
-    connection: asyncpg.Connection,
+    connection: Executor,
     /,
     record: asyncpg.Record,
 ) -> types.Move:
     return types.Move(*record)
 
 
+@traced
+@cached(tables.Moves)
 async def move(
-    connection: asyncpg.Connection,
+    connection: Executor,
     /,
     search_term: str,
 ) -> types.Move | None:
@@ -135,39 +233,255 @@ async def move(
     return await _move(connection, record)
 
 
-async def _pokemon(
-    connection: asyncpg.Connection,
+@traced
+async def move_many(
+    connection: Executor,
     /,
-    record: asyncpg.Record,
-) -> types.Pokemon:
-    dct = dict(record.items())
-    term = dct["term"]
+    search_terms: list[str],
+) -> list[types.Move | None]:
+    """Searches for multiple :class:`types.Move` at once.
+
+    Args:
+        search_terms (List[str]): The terms to search for
+    Returns:
+        List[Optional[types.Move]]: The best matching moves, in the same order as the search terms.
+    """
+    records = await _search_many(connection, tables.Moves, search_terms)
+    return [await _move(connection, record) if record is not None else None for record in records]
+
+
+_POKEMON_QUERY = f"""
+SELECT
+    pokemon.term,
+    pokemon.dex_no,
+    pokemon.classification,
+    names.term AS names_term,
+    names.english,
+    names.japanese,
+    names.kana,
+    dex_entries.term AS dex_entries_term,
+    dex_entries.sun,
+    dex_entries.moon,
+    base_stats.term AS base_stats_term,
+    base_stats.hp,
+    base_stats.attack,
+    base_stats.defense,
+    base_stats.special_attack,
+    base_stats.special_defense,
+    base_stats.speed,
+    typing.term AS typing_term,
+    typing.first AS primary_type,
+    typing.second AS secondary_type,
+    abilities.term AS abilities_term,
+    primary_ability.term AS primary_ability_term,
+    primary_ability.name AS primary_ability_name,
+    primary_ability.description AS primary_ability_description,
+    primary_ability.introduced AS primary_ability_introduced,
+    secondary_ability.term AS secondary_ability_term,
+    secondary_ability.name AS secondary_ability_name,
+    secondary_ability.description AS secondary_ability_description,
+    secondary_ability.introduced AS secondary_ability_introduced,
+    hidden_ability.term AS hidden_ability_term,
+    hidden_ability.name AS hidden_ability_name,
+    hidden_ability.description AS hidden_ability_description,
+    hidden_ability.introduced AS hidden_ability_introduced
+FROM {tables.Pokemon._name} AS pokemon
+LEFT JOIN {tables.PokemonNames._name} AS names ON names.term = pokemon.term
+LEFT JOIN {tables.PokemonDexEntries._name} AS dex_entries ON dex_entries.term = pokemon.term
+LEFT JOIN {tables.PokemonBaseStats._name} AS base_stats ON base_stats.term = pokemon.term
+LEFT JOIN {tables.PokemonTypes._name} AS typing ON typing.term = pokemon.term
+LEFT JOIN {tables.PokemonAbilities._name} AS abilities ON abilities.term = pokemon.term
+LEFT JOIN {tables.Abilities._name} AS primary_ability ON primary_ability.term = abilities.first
+LEFT JOIN {tables.Abilities._name} AS secondary_ability ON secondary_ability.term = abilities.second
+LEFT JOIN {tables.Abilities._name} AS hidden_ability ON hidden_ability.term = abilities.hidden
+WHERE pokemon.term = ANY($1::text[])
+"""
+
+
+def _build_ability(record: asyncpg.Record, slot: str) -> types.Ability | None:
+    term = record[f"{slot}_ability_term"]
+    if term is None:
+        return None
+
+    return types.intern(
+        types.Ability(
+            term,
+            record[f"{slot}_ability_name"],
+            record[f"{slot}_ability_description"],
+            record[f"{slot}_ability_introduced"],
+        )
+    )
+
+
+def _build_pokemon(record: asyncpg.Record) -> types.Pokemon:
+    term = record["term"]
+
+    name = None
+    if record["names_term"] is not None:
+        name = types.PokemonName(term, record["english"], record["japanese"], record["kana"])
+
+    pokedex_entries = None
+    if record["dex_entries_term"] is not None:
+        pokedex_entries = types.PokemonPokedexEntries(term, record["sun"], record["moon"])
+
+    base_stats = None
+    if record["base_stats_term"] is not None:
+        base_stats = types.PokemonBaseStats(
+            term,
+            record["hp"],
+            record["attack"],
+            record["defense"],
+            record["special_attack"],
+            record["special_defense"],
+            record["speed"],
+        )
+
+    typing = None
+    if record["typing_term"] is not None:
+        typing = types.PokemonTypings(term, record["primary_type"], record["secondary_type"])
+
+    abilities = None
+    if record["abilities_term"] is not None:
+        abilities = types.PokemonAbilities(
+            term, _build_ability(record, "primary"), _build_ability(record, "secondary"), _build_ability(record, "hidden")
+        )
+
+    return types.Pokemon(
+        term,
+        pokedex_number=record["dex_no"],
+        classification=record["classification"],
+        name=name,  # type: ignore
+        pokedex_entries=pokedex_entries,
+        evolutions=[],
+        base_stats=base_stats,
+        typing=typing,
+        abilities=abilities,
+    )
+
+
+def _build_pokemon_from_view(record: asyncpg.Record) -> tuple[types.Pokemon, list[str], list[str]]:
+    term = record["term"]
+    data = record["data"]
+    # JSONB is returned as a string when no codec is registered on the connection
+    if isinstance(data, str):
+        data = json.loads(data)
+
+    name = None
+    if data["name"] is not None:
+        name = types.PokemonName(*data["name"])
+
+    pokedex_entries = None
+    if data["pokedex_entries"] is not None:
+        pokedex_entries = types.PokemonPokedexEntries(*data["pokedex_entries"])
+
+    base_stats = None
+    if data["base_stats"] is not None:
+        base_stats = types.PokemonBaseStats(*data["base_stats"])
+
+    typing = None
+    if data["typing"] is not None:
+        _, primary, secondary = data["typing"]
+        typing = types.PokemonTypings(
+            term, tables.Typing[primary], tables.Typing[secondary] if secondary is not None else None
+        )
+
+    abilities = None
+    if data["abilities"] is not None:
+        abilities = types.PokemonAbilities(
+            term,
+            *(types.intern(types.Ability(*ability)) if ability is not None else None for ability in data["abilities"]),
+        )
+
+    pokemon = types.Pokemon(
+        term,
+        pokedex_number=record["dex_no"],
+        classification=data["classification"],
+        name=name,  # type: ignore
+        pokedex_entries=pokedex_entries,
+        evolutions=[],
+        base_stats=base_stats,
+        typing=typing,
+        abilities=abilities,
+    )
+    return pokemon, data["evolutions"], data["pre_evolutions"]
+
+
+async def _hydrate_pokemon(
+    connection: Executor,
+    /,
+    terms: list[str],
+) -> dict[str, types.Pokemon]:
+    graph = await get_evolution_graph(connection)
+
+    # Fetch each Pokemon's entire evolution family in a single query
+    with timed("evolutions"):
+        family = list(dict.fromkeys(member for term in terms for member in graph.family(term)))
+
+    if pokemon_view_enabled():
+        records = await fetch(
+            connection, f"SELECT term, dex_no, data FROM {POKEMON_VIEW} WHERE term = ANY($1::text[])", family, prepared=True
+        )
+        with timed("hydration"):
+            built = {record["term"]: _build_pokemon_from_view(record) for record in records}
+            hydrated = {term: pokemon for term, (pokemon, _, _) in built.items()}
+
+            for pokemon, evolutions, pre_evolutions in built.values():
+                pokemon.evolutions.extend(hydrated[evolution] for evolution in evolutions if evolution in hydrated)
+                pokemon.pre_evolutions.extend(
+                    hydrated[pre_evolution] for pre_evolution in pre_evolutions if pre_evolution in hydrated
+                )
+
+        return hydrated
+
+    records = await fetch(connection, _POKEMON_QUERY, family, prepared=True)
+
+    with timed("hydration"):
+        hydrated = {record["term"]: _build_pokemon(record) for record in records}
 
-    # Retrieve additional objects
-    dct["name"] = await _fetch(connection, tables.PokemonNames, term, types.PokemonName)
-    dct["pokedex_entries"] = await _fetch(connection, tables.PokemonDexEntries, term, types.PokemonPokedexEntries)
-    dct["base_stats"] = await _fetch(connection, tables.PokemonBaseStats, term, types.PokemonBaseStats)
-    dct["typing"] = await _fetch(connection, tables.PokemonTypes, term, types.PokemonTypings)
-    dct["abilities"] = await _fetch(connection, tables.PokemonAbilities, term, types.PokemonAbilities)
+        for term, pokemon in hydrated.items():
+            pokemon.evolutions.extend(hydrated[evolution] for evolution in graph.evolutions(term) if evolution in hydrated)
+            pokemon.pre_evolutions.extend(
+                hydrated[pre_evolution] for pre_evolution in graph.pre_evolutions(term) if pre_evolution in hydrated
+            )
 
-    evolutions = await tables.PokemonEvolutions.fetch(connection, term=term)
-    dct["evolutions"] = [await pokemon(connection, record["evolution"]) for record in evolutions]
+    return hydrated
 
-    return types.Pokemon(*dct.values())
 
+async def _pokemon(
+    connection: Executor,
+    /,
+    record: asyncpg.Record,
+) -> types.Pokemon:
+    term = record["term"]
+    hydrated = await _hydrate_pokemon(connection, [term])
+    return hydrated[term]
 
-async def pokemon(connection: asyncpg.Connection, /, search_term: str) -> types.Pokemon | None:
+
+@traced
+@cached(tables.Pokemon)
+async def pokemon(connection: Executor, /, search_term: str) -> types.Pokemon | None:
     """Searches for a :class:`types.Pokemon`.
 
+    Pokemon can be searched for by their English, Romaji or Kana names, or by Pokedex number.
+
     Args:
         search_term (str): The term to search for
     Returns:
         types.Pokemon: The best matching Pokemon.
     """
-    if search_term.isdigit():
-        record = await tables.Pokemon.fetch_row(connection, dex_no=int(search_term))
+    if search_term.isdecimal():
+        dex_no = parse_dex_no(search_term)
+        if dex_no is None:
+            return None
+        record = await fetchrow(connection, f"SELECT * FROM {tables.Pokemon._name} WHERE dex_no = $1", dex_no, prepared=True)
     else:
-        record = await _search(connection, tables.Pokemon, search_term)
+        names = await get_name_index(connection)
+        with timed("matching"):
+            term = names.resolve(search_term)
+        if term is not None:
+            record = await fetchrow(connection, f"SELECT * FROM {tables.Pokemon._name} WHERE term = $1", term, prepared=True)
+        else:
+            record = await _search(connection, tables.Pokemon, search_term)
 
     if record is None:
         return None
@@ -175,53 +489,298 @@ async def pokemon(connection: asyncpg.Connection, /, search_term: str) -> types.
     return await _pokemon(connection, record)
 
 
-async def all_abilities(connection: asyncpg.Connection, /) -> AsyncIterator[types.Ability]:
-    """Returns an :class:`AsyncGenerator` of all :class:`types.Ability` in the database."""
-    for record in await tables.Abilities.fetch(connection):
-        yield await _ability(connection, record)
+async def _resolve_numbers(
+    connection: Executor,
+    /,
+    search_terms: list[str],
+    numbers: list[int],
+    terms: list[str | None],
+) -> None:
+    if not numbers:
+        return
+
+    records = await fetch(
+        connection,
+        f"""
+        SELECT matches.term
+        FROM unnest($1::smallint[]) WITH ORDINALITY AS numbers(dex_no, i)
+        LEFT JOIN LATERAL (
+            SELECT term FROM {tables.Pokemon._name} WHERE dex_no = numbers.dex_no LIMIT 1
+        ) AS matches ON true
+        ORDER BY numbers.i
+        """,
+        # Numbers out of range are passed as NULL, which matches no Pokemon
+        [parse_dex_no(search_terms[i]) for i in numbers],
+    )
+    for i, record in zip(numbers, records):
+        terms[i] = record["term"]
+
+
+async def _resolve_names(
+    connection: Executor,
+    /,
+    search_terms: list[str],
+    names: list[int],
+    terms: list[str | None],
+) -> None:
+    if not names:
+        return
+
+    name_index = await get_name_index(connection)
+    with timed("matching"):
+        for i in names:
+            terms[i] = name_index.resolve(search_terms[i])
+
+    unresolved = [i for i in names if terms[i] is None]
+    if unresolved:
+        matches = await _resolve_many(connection, tables.Pokemon, [search_terms[i] for i in unresolved])
+        for i, term in zip(unresolved, matches):
+            terms[i] = term
+
+
+@traced
+async def pokemon_many(
+    connection: Executor,
+    /,
+    search_terms: list[str],
+) -> list[types.Pokemon | None]:
+    """Searches for multiple :class:`types.Pokemon` at once.
 
+    Args:
+        search_terms (List[str]): The terms or Pokedex numbers to search for
+    Returns:
+        List[Optional[types.Pokemon]]: The best matching Pokemon, in the same order as the search terms.
+    """
+    terms: list[str | None] = [None] * len(search_terms)
+    numbers = [i for i, search_term in enumerate(search_terms) if search_term.isdecimal()]
+    names = [i for i, search_term in enumerate(search_terms) if not search_term.isdecimal()]
 
-async def all_items(connection: asyncpg.Connection, /) -> AsyncIterator[types.Item]:
-    """Returns an :class:`AsyncGenerator` of all :class:`types.Item` in the database."""
-    for record in await tables.Items.fetch(connection):
-        yield await _item(connection, record)
+    # Pokedex numbers and names are resolved independently, concurrently if a pool was given
+    await gather(
+        connection,
+        _resolve_numbers(connection, search_terms, numbers, terms),
+        _resolve_names(connection, search_terms, names, terms),
+        get_evolution_graph(connection),
+    )
 
+    hydrated = await _hydrate_pokemon(connection, list(filter(None, terms)))
+    return [hydrated.get(term) if term is not None else None for term in terms]
 
-async def all_moves(connection: asyncpg.Connection, /) -> AsyncIterator[types.Move]:
-    """Returns an :class:`AsyncGenerator` of all :class:`types.Move` in the database."""
-    for record in await tables.Moves.fetch(connection):
-        yield await _move(connection, record)
 
+@traced
+async def autocomplete(
+    connection: Executor,
+    /,
+    table: type[Table],
+    prefix: str,
+    limit: int = 25,
+) -> list[str]:
+    """Returns the terms in a table which start with a prefix, for autocompletion.
 
-async def all_pokemon(connection: asyncpg.Connection, /) -> AsyncIterator[types.Pokemon]:
-    """Returns an :class:`AsyncGenerator` of all :class:`types.Pokemon` in the database."""
-    for record in await tables.Pokemon.fetch(connection):
-        yield await _pokemon(connection, record)
+    Terms and names are matched case and accent insensitively, Pokemon also match by their
+    Romaji and Kana names. Completions are served from an in-memory index, without fetching
+    or hydrating any objects.
 
+    Args:
+        table (Type[Table]): The table to complete, one of :class:`tables.Abilities`,
+            :class:`tables.Items`, :class:`tables.Moves` or :class:`tables.Pokemon`.
+        prefix (str): The prefix to complete.
+        limit (int): The maximum number of terms to return.
+    Returns:
+        List[str]: The matching terms.
+    Raises:
+        ValueError: The table cannot be autocompleted.
+    """
+    check_searchable(table)
+    index = await get_prefix_index(connection, table)
+    return index.complete(prefix, limit)
 
-async def random_ability(connection: asyncpg.Connection, /) -> types.Ability:
-    """Returns a random :class:`types.Ability`."""
-    records = await tables.Abilities.fetch(connection)
 
-    return await _ability(connection, random.choice(records))  # type: ignore
+async def _random(
+    connection: Executor,
+    /,
+    table: type[Table],
+    k: int,
+) -> list[asyncpg.Record]:
+    # Sample from the cached term index so only the chosen rows are transferred
+    index = await get_index(connection, table)
+    if not 0 <= k <= len(index.terms):
+        raise ValueError(f"Cannot choose {k} from {table._name}, expected between 0 and {len(index.terms)}")
+    terms = random.sample(index.terms, k)
 
+    records = await fetch(connection, f"SELECT * FROM {table._name} WHERE term = ANY($1::text[])", terms, prepared=True)
+    order = {term: i for i, term in enumerate(terms)}
+    return sorted(records, key=lambda record: order[record["term"]])
 
-async def random_item(connection: asyncpg.Connection, /) -> types.Item:
-    """Returns a random :class:`types.Item`."""
-    records = await tables.Items.fetch(connection)
 
-    return await _item(connection, random.choice(records))  # type: ignore
+async def _batches(
+    connection: Executor,
+    /,
+    table: type[Table],
+    batch_size: int,
+) -> AsyncIterator[list[asyncpg.Record]]:
+    # Server-side cursors may only be used within a transaction
+    query = f"SELECT * FROM {table._name}"
+    async with acquire(connection, bounded=False) as connection, connection.transaction():
+        start = time.perf_counter()
+        cursor = await connection.cursor(query)
+        while records := await cursor.fetch(batch_size):
+            record_statement(query, start, len(records))
+            yield records
+            start = time.perf_counter()
+
+
+@traced
+async def all_abilities(connection: Executor, /, *, batch_size: int = 100) -> AsyncIterator[types.Ability]:
+    """Returns an :class:`AsyncGenerator` of all :class:`types.Ability` in the database.
+
+    Records are streamed from a server-side cursor within a transaction,
+    the generator should be closed if iteration is stopped early.
 
+    Args:
+        batch_size (int): The number of abilities to fetch from the database at a time.
+    """
+    async for records in _batches(connection, tables.Abilities, batch_size):
+        for record in records:
+            yield await _ability(connection, record)
+
+
+@traced
+async def all_items(connection: Executor, /, *, batch_size: int = 100) -> AsyncIterator[types.Item]:
+    """Returns an :class:`AsyncGenerator` of all :class:`types.Item` in the database.
+
+    Records are streamed from a server-side cursor within a transaction,
+    the generator should be closed if iteration is stopped early.
+
+    Args:
+        batch_size (int): The number of items to fetch from the database at a time.
+    """
+    async for records in _batches(connection, tables.Items, batch_size):
+        for record in records:
+            yield await _item(connection, record)
+
+
+@traced
+async def all_moves(connection: Executor, /, *, batch_size: int = 100) -> AsyncIterator[types.Move]:
+    """Returns an :class:`AsyncGenerator` of all :class:`types.Move` in the database.
+
+    Records are streamed from a server-side cursor within a transaction,
+    the generator should be closed if iteration is stopped early.
+
+    Args:
+        batch_size (int): The number of moves to fetch from the database at a time.
+    """
+    async for records in _batches(connection, tables.Moves, batch_size):
+        for record in records:
+            yield await _move(connection, record)
 
-async def random_move(connection: asyncpg.Connection, /) -> types.Move:
-    """Returns a random :class:`types.Move`."""
-    records = await tables.Moves.fetch(connection)
 
-    return await _move(connection, random.choice(records))  # type: ignore
+@traced
+async def all_pokemon(connection: Executor, /, *, batch_size: int = 100) -> AsyncIterator[types.Pokemon]:
+    """Returns an :class:`AsyncGenerator` of all :class:`types.Pokemon` in the database.
+
+    Records are streamed from a server-side cursor within a transaction,
+    the generator should be closed if iteration is stopped early.
+
+    Args:
+        batch_size (int): The number of Pokemon to fetch and hydrate from the database at a time.
+    """
+    # Hydrate on the cursor's connection, as a second connection must not be acquired while it is held
+    async with acquire(connection, bounded=False) as connection:
+        async for records in _batches(connection, tables.Pokemon, batch_size):
+            hydrated = await _hydrate_pokemon(connection, [record["term"] for record in records])
+            for record in records:
+                yield hydrated[record["term"]]
+
+
+@overload
+async def random_ability(connection: Executor, /) -> types.Ability: ...
+
+
+@overload
+async def random_ability(connection: Executor, /, k: int) -> list[types.Ability]: ...
+
+
+@traced
+async def random_ability(connection: Executor, /, k: int | None = None) -> types.Ability | list[types.Ability]:
+    """Returns a random :class:`types.Ability`.
+
+    Args:
+        k (int): If provided, returns a list of this many distinct abilities instead.
+    Raises:
+        ValueError: There are fewer than ``k`` abilities.
+    """
+    records = await _random(connection, tables.Abilities, 1 if k is None else k)
+    abilities = [await _ability(connection, record) for record in records]
+
+    return abilities if k is not None else abilities[0]
 
 
-async def random_pokemon(connection: asyncpg.Connection, /) -> types.Pokemon:
-    """Returns a random :class:`types.Pokemon`."""
-    records = await tables.Pokemon.fetch(connection)
+@overload
+async def random_item(connection: Executor, /) -> types.Item: ...
+
+
+@overload
+async def random_item(connection: Executor, /, k: int) -> list[types.Item]: ...
+
+
+@traced
+async def random_item(connection: Executor, /, k: int | None = None) -> types.Item | list[types.Item]:
+    """Returns a random :class:`types.Item`.
+
+    Args:
+        k (int): If provided, returns a list of this many distinct items instead.
+    Raises:
+        ValueError: There are fewer than ``k`` items.
+    """
+    records = await _random(connection, tables.Items, 1 if k is None else k)
+    items = [await _item(connection, record) for record in records]
+
+    return items if k is not None else items[0]
+
+
+@overload
+async def random_move(connection: Executor, /) -> types.Move: ...
+
+
+@overload
+async def random_move(connection: Executor, /, k: int) -> list[types.Move]: ...
+
+
+@traced
+async def random_move(connection: Executor, /, k: int | None = None) -> types.Move | list[types.Move]:
+    """Returns a random :class:`types.Move`.
+
+    Args:
+        k (int): If provided, returns a list of this many distinct moves instead.
+    Raises:
+        ValueError: There are fewer than ``k`` moves.
+    """
+    records = await _random(connection, tables.Moves, 1 if k is None else k)
+    moves = [await _move(connection, record) for record in records]
+
+    return moves if k is not None else moves[0]
+
+
+@overload
+async def random_pokemon(connection: Executor, /) -> types.Pokemon: ...
+
+
+@overload
+async def random_pokemon(connection: Executor, /, k: int) -> list[types.Pokemon]: ...
+
+
+@traced
+async def random_pokemon(connection: Executor, /, k: int | None = None) -> types.Pokemon | list[types.Pokemon]:
+    """Returns a random :class:`types.Pokemon`.
+
+    Args:
+        k (int): If provided, returns a list of this many distinct Pokemon instead.
+    Raises:
+        ValueError: There are fewer than ``k`` Pokemon.
+    """
+    records = await _random(connection, tables.Pokemon, 1 if k is None else k)
+    hydrated = await _hydrate_pokemon(connection, [record["term"] for record in records])
+    pokemon = [hydrated[record["term"]] for record in records]
 
-    return await _pokemon(connection, random.choice(records))  # type: ignore
+    return pokemon if k is not None else pokemon[0]
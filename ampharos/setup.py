@@ -1,40 +1,207 @@
-import json
-from collections import namedtuple
-from typing import Any, List, Tuple
+import asyncio
+import logging
+import time
+from typing import Any, cast
 
 import asyncpg
+from donphan import Table
 
-from .tables import ALL_TABLES, TRANSFORMERS
-from .utils import get_base_dir
+from . import __version__
+from .cache import clear_cache
+from .concurrency import Executor, acquire
+from .effectiveness import clear_type_index
+from .index import create_trigram_indexes, rebuild_indexes, set_pg_trgm
+from .loader import REFERENCED, sanitise_records
+from .snapshot import data_hash, load_records
+from .statements import clear_prepared_statements
+from .stats import clear_stat_matrix
+from .tables import ALL_TABLES, TRANSFORMERS, Metadata
+from .types import clear_interned
+from .views import create_pokemon_view, pokemon_view_exists, refresh_pokemon_view, set_pokemon_view
 
-BASE_DIR = get_base_dir()
+log = logging.getLogger(__name__)
 
 
-async def setup_ampharos(connection: asyncpg.Connection):
-    """Populates the Pokemon database.
+def _load_records(table: type[Table]) -> list[tuple[Any, ...]]:
+    try:
+        return load_records(table)
+    except FileNotFoundError:
+        log.warning("Could not find Pokemon data file %s.json", table.__name__.lower())
+        return []
+
+
+async def _create_indexes(connection: asyncpg.Connection, /, table: type[Table]) -> None:
+    # donphan does not create the indexes for columns declared with index=True
+    for column in table._columns:
+        if column.index and not column.primary_key:
+            await connection.execute(
+                f"CREATE INDEX IF NOT EXISTS {table._local_name}_{column.name}_idx ON {table._name} ({column.name})"
+            )
+
+
+async def _sync_table(
+    connection: asyncpg.Connection,
+    /,
+    table: type[Table],
+    rows: list[tuple[Any, ...]],
+) -> list[tuple[Any, ...]]:
+    # Upserts changed rows, returning the primary keys of the rows to delete
+    columns = list(table._columns)
+    primary_key = [i for i, column in enumerate(columns) if column.primary_key]
+
+    existing = {tuple(record[i] for i in primary_key): tuple(record.values()) for record in await table.fetch(connection)}
+    changed = [row for row in rows if existing.get(tuple(row[i] for i in primary_key)) != row]
+
+    if changed:
+        update = [column for column in columns if not column.primary_key]
+        await table.insert_many(
+            connection, columns, *changed, ignore_on_conflict=not update, update_on_conflict=update or None
+        )
+
+    keys = {tuple(row[i] for i in primary_key) for row in rows}
+    return [key for key in existing if key not in keys]
+
 
-    This method should always be called on startup"""
-    # Populate the tables if required
-    for table in ALL_TABLES:
+async def _delete_rows(
+    connection: asyncpg.Connection,
+    /,
+    table: type[Table],
+    keys: list[tuple[Any, ...]],
+) -> None:
+    primary_key = [column for column in table._columns if column.primary_key]
+    names = ", ".join(column.name for column in primary_key)
+    arrays = ", ".join(f"${i}::{column.sql_type.sql_type}[]" for i, column in enumerate(primary_key, 1))
+
+    await connection.execute(
+        f"DELETE FROM {table._name} WHERE ({names}) IN (SELECT * FROM unnest({arrays}))",
+        *(list(values) for values in zip(*keys)),
+    )
+
+
+async def _setup(connection: asyncpg.Connection, /, *, pg_trgm: bool, materialized_view: bool) -> dict[str, float]:
+    for table in (*ALL_TABLES, Metadata):
         await table.create(connection)
+        await _create_indexes(connection, table)
+
+    # Determine which tables are out of date
+    hashes = dict(zip(ALL_TABLES, await asyncio.gather(*(asyncio.to_thread(data_hash, table) for table in ALL_TABLES))))
+    synced = {record["name"]: record["hash"] for record in await Metadata.fetch(connection)}
+    changed = [table for table in ALL_TABLES if hashes[table] is not None and synced.get(table._name) != hashes[table]]
+
+    # Parse the data files off the event loop
+    data = await asyncio.gather(*(asyncio.to_thread(_load_records, table) for table in changed))
+    records = dict(zip(changed, data))
+
+    timings: dict[str, float] = {}
+    deletions: list[tuple[type[Table], list[tuple[Any, ...]]]] = []
+
+    async with connection.transaction():
+        keys: dict[type[Table], set[Any]] = {}
+        shrunk: set[type[Table]] = set()
+
+        for table in ALL_TABLES:
+            # Tables which reference removed keys are synchronised too, even if their data is unchanged
+            if table not in records and any(
+                column.references is not None and column.references.table in shrunk for column in table._columns
+            ):
+                records[table] = await asyncio.to_thread(_load_records, table)
+
+            rows = None
+            if table in records:
+                start = time.perf_counter()
+                rows = sanitise_records(table, records[table], keys)
+
+                if await table.fetch_row(connection) is not None:
+                    deleted = await _sync_table(connection, table, rows)
+                    deletions.append((table, deleted))
+                    if deleted and table in REFERENCED:
+                        shrunk.add(table)
+                elif table in TRANSFORMERS:
+                    # Binary COPY cannot use the text codecs registered for enum types
+                    await table.insert_many(connection, table._columns, *rows)
+                else:
+                    await connection.copy_records_to_table(
+                        table._local_name,
+                        schema_name=table._schema,
+                        columns=[column.name for column in table._columns],
+                        records=rows,
+                    )
+
+                timings[table._name] = time.perf_counter() - start
+                log.info("Synchronised %d rows into %s in %.3fs", len(rows), table._name, timings[table._name])
+
+            # Track the keys of referenced tables for sanitising the rows which reference them
+            if table in REFERENCED:
+                name = REFERENCED[table]
+                if rows is not None:
+                    index = [column.name for column in table._columns].index(name)
+                    keys[table] = {row[index] for row in rows}
+                else:
+                    keys[table] = {record[name] for record in await connection.fetch(f"SELECT {name} FROM {table._name}")}
+
+        # Remove rows from referencing tables first
+        for table, deleted in reversed(deletions):
+            if deleted:
+                await _delete_rows(connection, table, deleted)
+                log.info("Deleted %d rows from %s", len(deleted), table._name)
+
+        if changed:
+            await Metadata.insert_many(
+                connection,
+                Metadata._columns,
+                *((table._name, hashes[table], __version__) for table in changed),
+                update_on_conflict=[Metadata.hash, Metadata.version],
+            )
+
+    if timings:
+        await connection.execute("ANALYZE " + ", ".join(timings))
+
+    if pg_trgm:
+        await create_trigram_indexes(connection)
+    set_pg_trgm(pg_trgm)
+
+    # The view is populated when it is created, otherwise it is refreshed even if it is no longer used,
+    # so it is not stale should it be used again
+    created = materialized_view and await create_pokemon_view(connection)
+    if timings and not created and await pokemon_view_exists(connection):
+        await refresh_pokemon_view(connection)
+    set_pokemon_view(materialized_view)
+
+    return timings
+
+
+async def setup_ampharos(
+    connection: Executor, *, pg_trgm: bool = False, materialized_view: bool = False
+) -> dict[str, float]:
+    """Populates the Pokemon database.
+
+    This method should always be called on startup
+
+    A hash of each data file is recorded in :class:`tables.Metadata`, tables whose data file has changed
+    are synchronised by upserting changed rows and deleting removed rows within a single transaction,
+    so a failed sync leaves the database unchanged. Tables referencing removed rows are synchronised too. Empty tables are populated using binary ``COPY``
+    where possible. Data is read from the precompiled snapshot when it is up to date, see :mod:`snapshot`.
+
+    If a pool is given the data is synchronised on a single connection, and the in-memory
+    indexes are rebuilt concurrently.
+
+    Args:
+        pg_trgm (bool): Whether to create ``pg_trgm`` indexes and perform fuzzy matching in the database.
+        materialized_view (bool): Whether to create a materialized view of fully hydrated Pokemon and
+            hydrate Pokemon from it, see :func:`views.create_pokemon_view`.
+    Returns:
+        Dict[str, float]: The number of seconds taken to synchronise each changed table.
+    """
+    async with acquire(connection) as acquired:
+        # Donphan only accepts connections, pooled connections proxy every connection method
+        timings = await _setup(cast(asyncpg.Connection, acquired), pg_trgm=pg_trgm, materialized_view=materialized_view)
+
+    # Refresh the in-memory term indexes and evolution graph
+    await rebuild_indexes(connection)
+    clear_cache()
+    clear_interned()
+    clear_prepared_statements()
+    clear_stat_matrix()
+    clear_type_index()
 
-        # If Table is empty
-        if await table.fetch_row(connection) is not None:
-            continue
-
-        record = namedtuple("record", (column.name for column in table._columns))
-        data: List[Tuple[Any, ...]] = []
-
-        try:
-            with open(BASE_DIR / f"data/{table.__name__.lower()}.json") as f:
-                for item in json.load(f):
-                    for key, transformer in TRANSFORMERS.get(table, {}).items():
-                        item[key] = transformer(item[key])
-                    data.append(record(**item))
-        except FileNotFoundError:
-            print(f"Could not find Pokemon data file {table.__name__.lower()}.json")
-        else:
-            try:
-                await table.insert_many(connection, table._columns, *data)
-            except Exception as e:
-                print(e)
+    return timings
@@ -0,0 +1,239 @@
+import hashlib
+import mmap
+import struct
+import sys
+from array import array
+from typing import Any
+
+from donphan import Enum, Table
+
+from .tables import ALL_TABLES, TRANSFORMERS
+from .utils import get_base_dir, hash_data, load_data
+
+__all__ = (
+    "SNAPSHOT_PATH",
+    "build",
+    "load_records",
+    "data_hash",
+)
+
+SNAPSHOT_PATH = get_base_dir() / "data/snapshot.bin"
+
+MAGIC = b"AMPHAROS"
+FORMAT_VERSION = 1
+
+# Column encodings
+TEXT = 0
+INTEGER = 1
+ENUM = 2
+
+NULL_INTEGER = -(2**31)
+
+_HEADER = struct.Struct("<8sHH")
+_ENTRY = struct.Struct("<32sII")
+_TABLE = struct.Struct("<IH")
+_COLUMN = struct.Struct("<BH")
+
+
+def _kind(column: Any) -> int:
+    py_type = column.py_type
+    if isinstance(py_type, type) and issubclass(py_type, Enum):
+        return ENUM
+    if column.sql_type.sql_type in ("SMALLINT", "INTEGER"):
+        return INTEGER
+    return TEXT
+
+
+def _pack(values: array) -> bytes:
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values.tobytes()
+
+
+def _unpack(typecode: str, data: bytes | memoryview) -> array:
+    values = array(typecode)
+    values.frombytes(data)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+def _encode_table(table: type[Table], data: list[dict[str, Any]]) -> bytes:
+    columns = list(table._columns)
+    chunks = [_TABLE.pack(len(data), len(columns))]
+
+    for column in columns:
+        kind = _kind(column)
+        name = column.name.encode()
+        values = [item[column.name] for item in data]
+        chunks.append(_COLUMN.pack(kind, len(name)))
+        chunks.append(name)
+
+        if kind == TEXT:
+            if any(value is not None and "\0" in value for value in values):
+                raise ValueError(f"{table._name}.{column.name} contains a NUL character")
+            chunks.append(bytes(value is None for value in values))
+            blob = "\0".join(value or "" for value in values).encode()
+            chunks.append(struct.pack("<I", len(blob)))
+            chunks.append(blob)
+        elif kind == INTEGER:
+            chunks.append(_pack(array("i", (value if value is not None else NULL_INTEGER for value in values))))
+        else:
+            enum: type[Enum] = column.py_type
+            chunks.append(_pack(array("B", (enum[value].value if value is not None else 0 for value in values))))
+
+    return b"".join(chunks)
+
+
+def _decode_table(table: type[Table], view: memoryview) -> list[tuple[Any, ...]]:
+    rows, count = _TABLE.unpack_from(view)
+    offset = _TABLE.size
+    columns: list[list[Any]] = []
+
+    for column in table._columns:
+        kind, length = _COLUMN.unpack_from(view, offset)
+        offset += _COLUMN.size
+        name = bytes(view[offset : offset + length]).decode()
+        offset += length
+        if name != column.name:
+            raise ValueError(f"Snapshot column {name} does not match {table._name}.{column.name}")
+
+        if kind == TEXT:
+            nulls = bytes(view[offset : offset + rows])
+            offset += rows
+            (size,) = struct.unpack_from("<I", view, offset)
+            offset += 4
+            values: list[Any] = str(view[offset : offset + size], "utf-8").split("\0") if rows else []
+            offset += size
+
+            if 1 in nulls:
+                values = [None if null else value for null, value in zip(nulls, values)]
+            columns.append(values)
+        elif kind == INTEGER:
+            integers = _unpack("i", view[offset : offset + rows * 4])
+            offset += rows * 4
+            columns.append([value if value != NULL_INTEGER else None for value in integers])
+        else:
+            enum: type[Enum] = column.py_type
+            lookup: list[Any] = [None] * 256
+            for member in enum:
+                lookup[member.value] = member
+            columns.append([lookup[value] for value in _unpack("B", view[offset : offset + rows])])
+            offset += rows
+
+    if len(columns) != count:
+        raise ValueError(f"Snapshot column count does not match {table._name}")
+
+    return list(zip(*columns))
+
+
+def build(path=SNAPSHOT_PATH) -> None:
+    """Builds a compact snapshot of the bundled JSON data files.
+
+    Each table is stored column by column, with text columns as a single NUL separated
+    string, and integers and enums as packed arrays, so the snapshot can be memory-mapped
+    and each table read independently. The hash of the source JSON file is recorded so
+    outdated snapshots are ignored.
+
+    Args:
+        path (pathlib.Path): Where to write the snapshot.
+    """
+    names: list[bytes] = []
+    entries: list[tuple[bytes, bytes]] = []
+
+    for table in ALL_TABLES:
+        name = table.__name__.lower()
+        source = (get_base_dir() / f"data/{name}.json").read_bytes()
+        names.append(name.encode())
+        entries.append((hashlib.sha256(source).digest(), _encode_table(table, load_data(name))))
+
+    directory = [_HEADER.pack(MAGIC, FORMAT_VERSION, len(entries))]
+    for name in names:
+        directory.append(struct.pack("<H", len(name)) + name)
+
+    offset = sum(map(len, directory)) + _ENTRY.size * len(entries)
+    for digest, chunk in entries:
+        directory.append(_ENTRY.pack(digest, offset, len(chunk)))
+        offset += len(chunk)
+
+    with open(path, "wb") as f:
+        f.write(b"".join(directory))
+        for _, chunk in entries:
+            f.write(chunk)
+
+
+_SNAPSHOT: dict[str, tuple[str, memoryview]] | None = None
+
+
+def _snapshot() -> dict[str, tuple[str, memoryview]]:
+    global _SNAPSHOT
+    if _SNAPSHOT is not None:
+        return _SNAPSHOT
+
+    _SNAPSHOT = {}
+    try:
+        with open(SNAPSHOT_PATH, "rb") as f:
+            view = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+    except (FileNotFoundError, ValueError):
+        return _SNAPSHOT
+
+    magic, version, count = _HEADER.unpack_from(view)
+    if magic != MAGIC or version != FORMAT_VERSION:
+        return _SNAPSHOT
+
+    offset = _HEADER.size
+    names = []
+    for _ in range(count):
+        (length,) = struct.unpack_from("<H", view, offset)
+        names.append(bytes(view[offset + 2 : offset + 2 + length]).decode())
+        offset += 2 + length
+
+    for name in names:
+        digest, start, length = _ENTRY.unpack_from(view, offset)
+        offset += _ENTRY.size
+        _SNAPSHOT[name] = (digest.hex(), view[start : start + length])
+
+    return _SNAPSHOT
+
+
+def data_hash(table: type[Table]) -> str | None:
+    """Returns the hash of a table's source data, or ``None`` if there is no data for the table."""
+    name = table.__name__.lower()
+    try:
+        return hash_data(name)
+    except FileNotFoundError:
+        entry = _snapshot().get(name)
+        return entry[0] if entry is not None else None
+
+
+def load_records(table: type[Table]) -> list[tuple[Any, ...]]:
+    """Loads the bundled data for a table.
+
+    Rows are read from the snapshot when it is up to date with the JSON data file,
+    otherwise the JSON data file is parsed.
+
+    Args:
+        table (Type[Table]): The table to load the data for.
+    Returns:
+        List[Tuple[Any, ...]]: The table's rows, in column order, with enums decoded.
+    Raises:
+        FileNotFoundError: There is no data for the table.
+    """
+    name = table.__name__.lower()
+    entry = _snapshot().get(name)
+
+    if entry is not None and entry[0] == data_hash(table):
+        return _decode_table(table, entry[1])
+
+    transformers = TRANSFORMERS.get(table, {})
+    return [
+        tuple(
+            transformers[column.name](item[column.name]) if column.name in transformers else item[column.name]
+            for column in table._columns
+        )
+        for item in load_data(name)
+    ]
+
+
+if __name__ == "__main__":
+    build()
@@ -0,0 +1,119 @@
+import itertools
+import logging
+from typing import Any
+
+import asyncpg
+from asyncpg.pool import PoolConnectionProxy
+from asyncpg.prepared_stmt import PreparedStatement
+
+from .concurrency import Connection
+
+__all__ = (
+    "set_prepared_statements",
+    "prepared_statements_enabled",
+    "clear_prepared_statements",
+)
+
+log = logging.getLogger(__name__)
+
+_ENABLED = True
+
+# The statements prepared on each underlying connection, keyed by their query
+_PREPARED: dict[asyncpg.Connection, dict[str, PreparedStatement]] = {}
+
+# Raised when a statement is missing on the server, or already exists there. This happens when
+# the statements were deallocated, or behind a pooler which runs statements on a different server
+# connection to the one they were prepared on
+_POOLER_ERRORS = (asyncpg.InvalidSQLStatementNameError, asyncpg.DuplicatePreparedStatementError)
+
+# The number of times statements may be lost before a pooler is assumed and they are disabled
+_MAX_FAILURES = 3
+
+_FAILURES = 0
+
+# Statements are named, as unnamed statements are replaced by the next query when asyncpg's statement cache is disabled
+_NAMES = (f"__ampharos_stmt_{i}__" for i in itertools.count(1))
+
+
+def set_prepared_statements(enabled: bool = True) -> None:
+    """Sets whether the hot lookup queries are run as explicitly prepared statements.
+
+    Statements are prepared once per connection, including connections acquired from a pool.
+    If the statements are repeatedly lost on the server, as they are behind a connection pooler
+    such as PgBouncer in transaction mode, they are disabled automatically, but may also be
+    disabled upfront.
+
+    Args:
+        enabled (bool): Whether to use prepared statements.
+    """
+    global _ENABLED, _FAILURES
+    _ENABLED = enabled
+    _FAILURES = 0
+    _PREPARED.clear()
+
+
+def prepared_statements_enabled() -> bool:
+    """Returns whether the hot lookup queries are run as explicitly prepared statements."""
+    return _ENABLED
+
+
+def clear_prepared_statements() -> None:
+    """Discards every prepared statement, they will be prepared again on next use."""
+    _PREPARED.clear()
+
+
+def _unwrap(connection: Connection) -> asyncpg.Connection:
+    # Statements are kept for the underlying connection, which outlives each acquisition from a pool
+    if isinstance(connection, PoolConnectionProxy):
+        return connection._con  # type: ignore
+    return connection
+
+
+async def _prepare(connection: Connection, query: str) -> PreparedStatement:
+    underlying = _unwrap(connection)
+    statements = _PREPARED.get(underlying)
+    if statements is None:
+        # Forget the statements of connections which have since been closed
+        for closed in [connection for connection in _PREPARED if connection.is_closed()]:
+            del _PREPARED[closed]
+        statements = _PREPARED[underlying] = {}
+
+    statement = statements.get(query)
+    if statement is None:
+        statement = statements[query] = await connection.prepare(query, name=next(_NAMES))
+    elif statement._con_release_ctr != underlying._pool_release_ctr:
+        # asyncpg refuses statements prepared before their connection was last released to its pool,
+        # though they remain prepared on the server, so they are rebound rather than prepared again.
+        # This relies on asyncpg internals, which are unchanged in the versions pinned by pyproject.toml
+        statement = statements[query] = PreparedStatement(underlying, query, statement._state)
+    return statement
+
+
+async def run(connection: Connection, method: str, query: str, args: tuple[Any, ...]) -> Any:
+    """Runs a query with a prepared statement, falling back to an unprepared query if they are unavailable.
+
+    Args:
+        method (str): The method to run the query with, ``"fetch"`` or ``"fetchrow"``.
+    """
+    global _FAILURES
+
+    # Statements lost on the server are prepared again once
+    for _ in range(2):
+        if not _ENABLED:
+            break
+
+        try:
+            statement = await _prepare(connection, query)
+            return await getattr(statement, method)(*args)
+        except _POOLER_ERRORS:
+            _PREPARED.pop(_unwrap(connection), None)
+            _FAILURES += 1
+            if _FAILURES >= _MAX_FAILURES:
+                log.warning("Prepared statements are repeatedly lost by the connection, they have been disabled")
+                set_prepared_statements(False)
+        except asyncpg.InvalidCachedStatementError:
+            # The schema has changed since the statement was prepared
+            _PREPARED[_unwrap(connection)].pop(query, None)
+            break
+
+    return await getattr(connection, method)(query, *args)
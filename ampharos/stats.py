@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from typing import TYPE_CHECKING, Any
+
+from . import tables
+from .concurrency import Executor
+from .instrumentation import fetch
+
+if TYPE_CHECKING:
+    import numpy
+
+__all__ = (
+    "STATS",
+    "StatMatrix",
+    "get_stat_matrix",
+    "clear_stat_matrix",
+)
+
+STATS = ("hp", "attack", "defense", "special_attack", "special_defense", "speed")
+
+_STAT_MATRIX: StatMatrix | None = None
+
+
+def _numpy() -> Any:
+    # numpy is an optional dependency, install with the "stats" extra
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("numpy is not installed") from None
+    return numpy
+
+
+class StatMatrix:
+    """A NumPy matrix of Pokemon base stats, with one row per Pokemon.
+
+    Requires the optional ``numpy`` dependency.
+
+    Args:
+        terms (Sequence[str]): The terms of the Pokemon.
+        stats (Iterable[Sequence[int]]): Each Pokemon's base stats, in the order of :data:`STATS`.
+    Raises:
+        ImportError: numpy is not installed.
+    """
+
+    def __init__(self, terms: Sequence[str], stats: Iterable[Sequence[int]]) -> None:
+        np = _numpy()
+
+        self.terms: list[str] = list(terms)
+        self.matrix: numpy.ndarray = np.array(list(stats), dtype=np.int32).reshape(len(self.terms), len(STATS))
+        self.totals: numpy.ndarray = self.matrix.sum(axis=1)
+
+        self._rows: dict[str, int] = {term: i for i, term in enumerate(self.terms)}
+        self._sorted: dict[str, numpy.ndarray] = {}
+
+        # Rows scaled to unit length, so the dot product of two rows is their cosine similarity
+        norms = np.linalg.norm(self.matrix, axis=1, keepdims=True)
+        self._spreads: numpy.ndarray = self.matrix / np.where(norms == 0, 1, norms)
+
+    def __len__(self) -> int:
+        return len(self.terms)
+
+    def __contains__(self, term: object) -> bool:
+        return term in self._rows
+
+    def column(self, stat: str) -> numpy.ndarray:
+        """Returns the values of a stat for every Pokemon.
+
+        Args:
+            stat (str): The stat, one of :data:`STATS` or ``"total"``.
+        Returns:
+            numpy.ndarray: The values of the stat, in the order of :attr:`terms`.
+        Raises:
+            ValueError: An unknown stat was given.
+        """
+        if stat == "total":
+            return self.totals
+        if stat not in STATS:
+            raise ValueError(f"Unknown stat {stat!r}, expected one of {', '.join(STATS)} or total")
+        return self.matrix[:, STATS.index(stat)]
+
+    def top(self, stat: str = "total", n: int = 10, *, ascending: bool = False) -> list[tuple[str, int]]:
+        """Returns the Pokemon with the highest, or lowest, value of a stat.
+
+        Args:
+            stat (str): The stat to rank by, one of :data:`STATS` or ``"total"``.
+            n (int): The number of Pokemon to return.
+            ascending (bool): Whether to return the lowest values instead.
+        Returns:
+            List[Tuple[str, int]]: The terms of the Pokemon and their values, best first.
+        """
+        np = _numpy()
+        values = self.column(stat)
+        keys = values if ascending else -values.astype(np.int64)
+
+        n = min(n, len(values))
+        if n <= 0:
+            return []
+
+        candidates = np.argpartition(keys, n - 1)[:n]
+        # Order by value, breaking ties by row so results are stable
+        candidates = candidates[np.lexsort((candidates, keys[candidates]))]
+        return [(self.terms[i], int(values[i])) for i in candidates]
+
+    def percentile(self, term: str, stat: str = "total") -> float:
+        """Returns the percentile rank of a Pokemon's stat.
+
+        Args:
+            term (str): The term of the Pokemon.
+            stat (str): The stat, one of :data:`STATS` or ``"total"``.
+        Returns:
+            float: The percentage of Pokemon with a lower value, counting ties as half.
+        Raises:
+            KeyError: The Pokemon is not in the matrix.
+        """
+        np = _numpy()
+        values = self.column(stat)
+        if stat not in self._sorted:
+            self._sorted[stat] = np.sort(values)
+
+        ordered = self._sorted[stat]
+        value = values[self._rows[term]]
+        below = np.searchsorted(ordered, value, side="left")
+        above = np.searchsorted(ordered, value, side="right")
+        return float((below + above) / 2 / len(ordered) * 100)
+
+    def similar(self, term: str, n: int = 5) -> list[tuple[str, float]]:
+        """Returns the Pokemon with the most similar stat spread.
+
+        Stat spreads are compared by cosine similarity, so Pokemon with the same
+        proportions of stats are similar regardless of their stat total.
+
+        Args:
+            term (str): The term of the Pokemon.
+            n (int): The number of Pokemon to return.
+        Returns:
+            List[Tuple[str, float]]: The terms of the Pokemon and their similarity, most similar first.
+        Raises:
+            KeyError: The Pokemon is not in the matrix.
+        """
+        np = _numpy()
+        row = self._rows[term]
+        similarity = self._spreads @ self._spreads[row]
+        similarity[row] = -np.inf
+
+        n = min(n, len(similarity) - 1)
+        if n <= 0:
+            return []
+
+        candidates = np.argpartition(-similarity, n - 1)[:n]
+        candidates = candidates[np.lexsort((candidates, -similarity[candidates]))]
+        return [(self.terms[i], float(similarity[i])) for i in candidates]
+
+
+async def get_stat_matrix(connection: Executor, /) -> StatMatrix:
+    """Returns the :class:`StatMatrix` of every Pokemon's base stats, building it on first use.
+
+    Raises:
+        ImportError: numpy is not installed.
+    """
+    global _STAT_MATRIX
+    if _STAT_MATRIX is None:
+        records = await fetch(
+            connection, f"SELECT term, {', '.join(STATS)} FROM {tables.PokemonBaseStats._name} ORDER BY term"
+        )
+        _STAT_MATRIX = StatMatrix([record["term"] for record in records], (tuple(record)[1:] for record in records))
+    return _STAT_MATRIX
+
+
+def clear_stat_matrix() -> None:
+    """Discards the :class:`StatMatrix`, it will be rebuilt on next use."""
+    global _STAT_MATRIX
+    _STAT_MATRIX = None
@@ -52,18 +52,18 @@ class Items(Table, _name="items", schema="ampharos"):
 
 class Moves(Table, _name="moves", schema="ampharos"):
     term: Column[SQLType.Text] = Column(primary_key=True)
-    type: Column[Typing] = Column(nullable=False)
+    type: Column[Typing] = Column(nullable=False, index=True)
     name: Column[SQLType.Text] = Column(nullable=False)
     description: Column[SQLType.Text]
     pp: Column[SQLType.SmallInt]
-    power: Column[SQLType.SmallInt]
+    power: Column[SQLType.SmallInt] = Column(index=True)
     accuracy: Column[SQLType.SmallInt]
-    category: Column[Category]
+    category: Column[Category] = Column(index=True)
 
 
 class Pokemon(Table, _name="pokemon", schema="ampharos"):
     term: Column[SQLType.Text] = Column(primary_key=True)
-    dex_no: Column[SQLType.SmallInt] = Column(nullable=False)
+    dex_no: Column[SQLType.SmallInt] = Column(nullable=False, index=True)
     classification: Column[SQLType.Text]
 
 
@@ -87,8 +87,8 @@ class PokemonDexEntries(Table, _name="pokemondexentries", schema="ampharos"):
 
 class PokemonTypes(Table, _name="pokemontypes", schema="ampharos"):
     term: Column[SQLType.Text] = Column(primary_key=True, references=Pokemon.term)
-    first: Column[Typing] = Column(nullable=False)
-    second: Column[Typing]
+    first: Column[Typing] = Column(nullable=False, index=True)
+    second: Column[Typing] = Column(index=True)
 
 
 class PokemonAbilities(Table, _name="pokemonabilities", schema="ampharos"):
@@ -100,12 +100,18 @@ class PokemonAbilities(Table, _name="pokemonabilities", schema="ampharos"):
 
 class PokemonBaseStats(Table, _name="pokemonbasestats", schema="ampharos"):
     term: Column[SQLType.Text] = Column(primary_key=True, references=Pokemon.term)
-    hp: Column[SQLType.SmallInt]
-    attack: Column[SQLType.SmallInt]
-    defense: Column[SQLType.SmallInt]
-    special_attack: Column[SQLType.SmallInt]
-    special_defense: Column[SQLType.SmallInt]
-    speed: Column[SQLType.SmallInt]
+    hp: Column[SQLType.SmallInt] = Column(index=True)
+    attack: Column[SQLType.SmallInt] = Column(index=True)
+    defense: Column[SQLType.SmallInt] = Column(index=True)
+    special_attack: Column[SQLType.SmallInt] = Column(index=True)
+    special_defense: Column[SQLType.SmallInt] = Column(index=True)
+    speed: Column[SQLType.SmallInt] = Column(index=True)
+
+
+class Metadata(Table, _name="metadata", schema="ampharos"):
+    name: Column[SQLType.Text] = Column(primary_key=True)
+    hash: Column[SQLType.Text] = Column(nullable=False)
+    version: Column[SQLType.Text] = Column(nullable=False)
 
 
 ALL_TABLES: list[type[Table]] = [
@@ -124,6 +130,6 @@ ALL_TABLES: list[type[Table]] = [
 TRANSFORMERS: dict[type[Table], dict[str, Callable[[Any], Any]]] = defaultdict(dict)
 
 for table in ALL_TABLES:
-    for column in Table._columns:
-        if issubclass(column.py_type, Enum):
-            TRANSFORMERS[table][column.name] = lambda x: column.py_type[x]
+    for column in table._columns:
+        if isinstance(column.py_type, type) and issubclass(column.py_type, Enum):
+            TRANSFORMERS[table][column.name] = lambda x, enum=column.py_type: enum[x] if x is not None else None
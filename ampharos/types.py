@@ -1,21 +1,64 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from functools import cache
+from typing import TYPE_CHECKING, Any, TypeVar
 
-from .tables import Category, Typing
+if TYPE_CHECKING:
+    from .tables import Category, Typing
 
-try:
-    from ampharos_images import IMAGES_AVAILABLE, get_image  # type: ignore
-except ImportError:
-    IMAGES_AVAILABLE = False
+T = TypeVar("T")
 
+_INTERNED: dict[Any, Any] = {}
 
-@dataclass
+
+@cache
+def _get_image() -> Callable[[Any], bytes | None] | None:
+    # ampharos_images is probed on first use rather than at import time
+    try:
+        from ampharos_images import IMAGES_AVAILABLE, get_image  # type: ignore
+    except ImportError:
+        return None
+    return get_image if IMAGES_AVAILABLE else None
+
+
+def __getattr__(name: str) -> Any:
+    if name == "IMAGES_AVAILABLE":
+        return _get_image() is not None
+    if name in ("Category", "Typing"):
+        from . import tables
+
+        return getattr(tables, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def intern(obj: T) -> T:
+    """Returns the shared instance of an object.
+
+    Objects are frozen, so equal objects can safely be shared, for example between every
+    Pokemon with the same ability, reducing memory usage. Objects holding the term of a
+    Pokemon should not be interned, as they are only equal for the same Pokemon.
+
+    Args:
+        obj (T): The object to intern.
+    Returns:
+        T: The first interned object equal to ``obj``, or ``obj`` itself.
+    """
+    return _INTERNED.setdefault(obj, obj)
+
+
+def clear_interned() -> None:
+    """Discards all interned objects."""
+    _INTERNED.clear()
+
+
+@dataclass(frozen=True, slots=True)
 class _BasePokemonObject:
     _term: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Ability(_BasePokemonObject):
     """Represents an ability.
 
@@ -30,7 +73,7 @@ class Ability(_BasePokemonObject):
     introduced: int
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Item(_BasePokemonObject):
     """Represents an item.
 
@@ -43,7 +86,7 @@ class Item(_BasePokemonObject):
     description: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Move(_BasePokemonObject):
     """Represents a move.
 
@@ -66,7 +109,7 @@ class Move(_BasePokemonObject):
     category: Category
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PokemonName(_BasePokemonObject):
     """Represents a Pokemon's name.
 
@@ -81,7 +124,7 @@ class PokemonName(_BasePokemonObject):
     kana: str | None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PokemonBaseStats(_BasePokemonObject):
     """Represents a Pokemon's base stats.
 
@@ -116,20 +159,20 @@ class PokemonBaseStats(_BasePokemonObject):
         )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PokemonTypings(_BasePokemonObject):
     """Represents a Pokemon's Typing.
 
     Attributes:
         primary (types.Typing)
-        secondary (types.Typing)
+        secondary (Optional[types.Typing])
     """
 
     primary: Typing
-    secondary: Typing
+    secondary: Typing | None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PokemonPokedexEntries(_BasePokemonObject):
     """Represents a Pokemon's Pokedex Entries.
 
@@ -142,22 +185,22 @@ class PokemonPokedexEntries(_BasePokemonObject):
     moon: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PokemonAbilities(_BasePokemonObject):
     """Represents a Pokemon's Abilities.
 
     Attributes:
-        primary (types.Ability)
-        secondary (types.Ability)
-        hidden (types.Ability)
+        primary (Optional[types.Ability])
+        secondary (Optional[types.Ability])
+        hidden (Optional[types.Ability])
     """
 
-    primary: Ability
-    secondary: Ability
-    hidden: Ability
+    primary: Ability | None
+    secondary: Ability | None
+    hidden: Ability | None
 
 
-@dataclass()
+@dataclass(frozen=True, slots=True)
 class Pokemon(_BasePokemonObject):
     """Represents a Pokemon.
 
@@ -168,6 +211,7 @@ class Pokemon(_BasePokemonObject):
         typing (types.PokemonTypings): The Pokemon's Typing
         pokedex_entries (types.PokemonPokedexEntries): The Pokemon's Pokedex Entries
         evolutions (List[types.Pokemon]): A list of Pokemon this Pokemon can evolve into
+        pre_evolutions (List[types.Pokemon]): A list of Pokemon which evolve into this Pokemon
         base_stats (types.PokemonBaseStats): The Pokemon's Base Stats
         abilities: (types.PokemonAbilities): The Pokemon's Abilities
 
@@ -177,13 +221,38 @@ class Pokemon(_BasePokemonObject):
     classification: str
     name: PokemonName
     pokedex_entries: PokemonPokedexEntries | None
-    evolutions: list[Pokemon]
+    evolutions: list[Pokemon] = field(hash=False, compare=False)
     base_stats: PokemonBaseStats | None
     typing: PokemonTypings | None
     abilities: PokemonAbilities | None
+    pre_evolutions: list[Pokemon] = field(default_factory=list, repr=False, compare=False)
+
+    @property
+    def evolution_chain(self) -> list[Pokemon]:
+        """List[types.Pokemon]: Every Pokemon in this Pokemon's evolution family, starting from the base forms."""
+        seen = {id(self)}
+        queue: list[Pokemon] = [self]
+
+        for pokemon in queue:
+            for neighbour in (*pokemon.pre_evolutions, *pokemon.evolutions):
+                if id(neighbour) not in seen:
+                    seen.add(id(neighbour))
+                    queue.append(neighbour)
+
+        # Order the family from its base forms, keeping any members only reachable through a cycle
+        ordered = [pokemon for pokemon in queue if not pokemon.pre_evolutions]
+        chain_ids = {id(pokemon) for pokemon in ordered}
+        for pokemon in ordered:
+            for evolution in pokemon.evolutions:
+                if id(evolution) not in chain_ids:
+                    chain_ids.add(id(evolution))
+                    ordered.append(evolution)
+
+        return ordered + [pokemon for pokemon in queue if id(pokemon) not in chain_ids]
 
     @property
     def image(self) -> bytes | None:
-        if not IMAGES_AVAILABLE:
+        get_image = _get_image()
+        if get_image is None:
             raise ImportError("ampharos_images is not installed")
         return get_image(self)
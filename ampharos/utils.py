@@ -1,5 +1,18 @@
+import hashlib
+import json
 import pathlib
+from typing import Any
 
 
 def get_base_dir() -> pathlib.Path:
     return pathlib.Path(__file__).parent
+
+
+def load_data(name: str) -> list[dict[str, Any]]:
+    with open(get_base_dir() / f"data/{name}.json") as f:
+        return json.load(f)
+
+
+def hash_data(name: str) -> str:
+    with open(get_base_dir() / f"data/{name}.json", "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
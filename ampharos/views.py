@@ -0,0 +1,117 @@
+from donphan import Table
+
+from . import tables
+from .concurrency import Executor
+
+__all__ = (
+    "POKEMON_VIEW",
+    "pokemon_view_exists",
+    "create_pokemon_view",
+    "refresh_pokemon_view",
+    "drop_pokemon_view",
+    "set_pokemon_view",
+    "pokemon_view_enabled",
+)
+
+POKEMON_VIEW = f"{tables.Pokemon._schema}.pokemon_hydrated"
+
+_USE_POKEMON_VIEW = False
+
+
+def _row(alias: str, table: type[Table]) -> str:
+    # Rows are stored as arrays in the order of their columns, so they can be unpacked into their types
+    columns = ", ".join(f"{alias}.{column.name}" for column in table._columns)
+    return f"CASE WHEN {alias}.term IS NULL THEN NULL ELSE jsonb_build_array({columns}) END"
+
+
+_POKEMON_VIEW_QUERY = f"""
+SELECT
+    pokemon.term,
+    pokemon.dex_no,
+    jsonb_build_object(
+        'classification', pokemon.classification,
+        'name', {_row("names", tables.PokemonNames)},
+        'pokedex_entries', {_row("dex_entries", tables.PokemonDexEntries)},
+        'base_stats', {_row("base_stats", tables.PokemonBaseStats)},
+        'typing', {_row("typing", tables.PokemonTypes)},
+        'abilities', CASE WHEN abilities.term IS NULL THEN NULL ELSE jsonb_build_array(
+            {_row("primary_ability", tables.Abilities)},
+            {_row("secondary_ability", tables.Abilities)},
+            {_row("hidden_ability", tables.Abilities)}
+        ) END,
+        'evolutions', COALESCE((
+            SELECT jsonb_agg(evolutions.evolution) FROM {tables.PokemonEvolutions._name} AS evolutions
+            WHERE evolutions.term = pokemon.term
+        ), '[]'::jsonb),
+        'pre_evolutions', COALESCE((
+            SELECT jsonb_agg(evolutions.term) FROM {tables.PokemonEvolutions._name} AS evolutions
+            WHERE evolutions.evolution = pokemon.term
+        ), '[]'::jsonb)
+    ) AS data
+FROM {tables.Pokemon._name} AS pokemon
+LEFT JOIN {tables.PokemonNames._name} AS names ON names.term = pokemon.term
+LEFT JOIN {tables.PokemonDexEntries._name} AS dex_entries ON dex_entries.term = pokemon.term
+LEFT JOIN {tables.PokemonBaseStats._name} AS base_stats ON base_stats.term = pokemon.term
+LEFT JOIN {tables.PokemonTypes._name} AS typing ON typing.term = pokemon.term
+LEFT JOIN {tables.PokemonAbilities._name} AS abilities ON abilities.term = pokemon.term
+LEFT JOIN {tables.Abilities._name} AS primary_ability ON primary_ability.term = abilities.first
+LEFT JOIN {tables.Abilities._name} AS secondary_ability ON secondary_ability.term = abilities.second
+LEFT JOIN {tables.Abilities._name} AS hidden_ability ON hidden_ability.term = abilities.hidden
+"""
+
+
+async def pokemon_view_exists(connection: Executor, /) -> bool:
+    """Returns whether the materialized view of fully hydrated Pokemon exists."""
+    return bool(await connection.fetchval("SELECT to_regclass($1) IS NOT NULL", POKEMON_VIEW))
+
+
+async def create_pokemon_view(connection: Executor, /) -> bool:
+    """Creates the materialized view of fully hydrated Pokemon, if it does not exist.
+
+    Each row holds a Pokemon's names, Pokedex entries, base stats, typing, abilities and
+    evolution terms as JSONB, so Pokemon can be hydrated without joining the Pokemon tables.
+    The view is indexed by ``term`` and ``dex_no``, the latter is not unique as forms share
+    their Pokedex number.
+
+    Returns:
+        bool: Whether the view was created.
+    """
+    if await pokemon_view_exists(connection):
+        return False
+
+    local_name = POKEMON_VIEW.rpartition(".")[2]
+    await connection.execute(f"CREATE MATERIALIZED VIEW {POKEMON_VIEW} AS {_POKEMON_VIEW_QUERY}")
+    await connection.execute(f"CREATE UNIQUE INDEX IF NOT EXISTS {local_name}_term_idx ON {POKEMON_VIEW} (term)")
+    await connection.execute(f"CREATE INDEX IF NOT EXISTS {local_name}_dex_no_idx ON {POKEMON_VIEW} (dex_no)")
+    return True
+
+
+async def refresh_pokemon_view(connection: Executor, /) -> None:
+    """Refreshes the materialized view of fully hydrated Pokemon.
+
+    The view is refreshed concurrently, so it can still be read while it is refreshed.
+    This should be called whenever the underlying data changes.
+    """
+    await connection.execute(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {POKEMON_VIEW}")
+
+
+async def drop_pokemon_view(connection: Executor, /) -> None:
+    """Drops the materialized view of fully hydrated Pokemon, if it exists."""
+    await connection.execute(f"DROP MATERIALIZED VIEW IF EXISTS {POKEMON_VIEW}")
+
+
+def set_pokemon_view(enabled: bool = True) -> None:
+    """Sets whether Pokemon are hydrated from the materialized view.
+
+    See :func:`create_pokemon_view` for creating the view.
+
+    Args:
+        enabled (bool): Whether to hydrate Pokemon from the view.
+    """
+    global _USE_POKEMON_VIEW
+    _USE_POKEMON_VIEW = enabled
+
+
+def pokemon_view_enabled() -> bool:
+    """Returns whether Pokemon are hydrated from the materialized view."""
+    return _USE_POKEMON_VIEW
@@ -0,0 +1,310 @@
+"""Benchmarks searches, hydration and setup against a local Postgres database.
+
+Reports latency percentiles, database round trips and peak traced memory for each benchmark,
+and optionally writes the results as JSON so they can be compared between releases. Note asyncpg
+allocates a 256 KiB buffer per query, which dominates the peak memory of small lookups.
+
+The database should be a throwaway one, ``--cold`` drops the ampharos schema to time a full load.
+``--backend memory`` runs the same lookups against the in-memory backend without a database.
+
+Usage:
+    python benchmarks/bench.py [--dsn DSN] [--iterations N] [--cold] [--output FILE] [--compare FILE]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from collections.abc import Awaitable, Callable
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import ampharos  # noqa: E402
+
+SEARCH_TERMS = {
+    "ability": ["static", "levitate", "intimidat", "swift swim", "pressur"],
+    "item": ["leftovers", "choice scarf", "lif orb", "focus sash", "rare candy"],
+    "move": ["thunderbolt", "earthquake", "flamethrowr", "surf", "ice beam"],
+    "pokemon": ["pikachu", "pikachew", "charizard", "garchomp", "ピカチュウ"],
+}
+
+
+@dataclass
+class Result:
+    iterations: int
+    mean_ms: float
+    p50_ms: float
+    p90_ms: float
+    p99_ms: float
+    min_ms: float
+    max_ms: float
+    round_trips: float
+    peak_memory_kib: float
+
+
+class RoundTrips:
+    """Counts the queries sent by a connection, including server-side cursor fetches and prepared statements."""
+
+    def __init__(self) -> None:
+        self.count = 0
+
+    def _log(self, record: Any) -> None:
+        self.count += 1
+
+    @contextmanager
+    def attach(self, connection: Any):
+        import asyncpg.cursor
+        import asyncpg.prepared_stmt
+
+        # Cursor fetches and the prepared statements run by ampharos.statements bypass the query loggers
+        Cursor, PreparedStatement = asyncpg.cursor.BaseCursor, asyncpg.prepared_stmt.PreparedStatement
+        originals = Cursor._exec, Cursor._bind_exec, PreparedStatement.fetch, PreparedStatement.fetchrow
+
+        def wrap(method: Any) -> Any:
+            async def wrapper(*args: Any, **kwargs: Any) -> Any:
+                self.count += 1
+                return await method(*args, **kwargs)
+
+            return wrapper
+
+        Cursor._exec, Cursor._bind_exec, PreparedStatement.fetch, PreparedStatement.fetchrow = map(wrap, originals)
+        connection.add_query_logger(self._log)
+        try:
+            yield self
+        finally:
+            connection.remove_query_logger(self._log)
+            Cursor._exec, Cursor._bind_exec, PreparedStatement.fetch, PreparedStatement.fetchrow = originals
+
+
+def percentile(timings: list[float], percent: float) -> float:
+    ordered = sorted(timings)
+    index = min(len(ordered) - 1, max(0, round(percent / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+async def measure(func: Callable[[], Awaitable[Any]], iterations: int, round_trips: RoundTrips | None = None) -> Result:
+    timings: list[float] = []
+    count = round_trips.count if round_trips is not None else 0
+
+    for _ in range(iterations):
+        start = time.perf_counter()
+        await func()
+        timings.append((time.perf_counter() - start) * 1000)
+
+    # Query loggers are called soon after each query completes
+    await asyncio.sleep(0)
+    trips = (round_trips.count - count) / iterations if round_trips is not None else 0.0
+
+    # Memory is measured in a separate run, as tracing slows down every allocation
+    tracemalloc.start()
+    await func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return Result(
+        iterations=iterations,
+        mean_ms=statistics.fmean(timings),
+        p50_ms=percentile(timings, 50),
+        p90_ms=percentile(timings, 90),
+        p99_ms=percentile(timings, 99),
+        min_ms=min(timings),
+        max_ms=max(timings),
+        round_trips=trips,
+        peak_memory_kib=peak / 1024,
+    )
+
+
+def cycle(values: list[str]) -> Callable[[], str]:
+    i = -1
+
+    def next_value() -> str:
+        nonlocal i
+        i = (i + 1) % len(values)
+        return values[i]
+
+    return next_value
+
+
+async def exhaust(iterator: Any) -> None:
+    async for _ in iterator:
+        pass
+
+
+def benchmarks(connection: Any) -> dict[str, tuple[Callable[[], Awaitable[Any]], int]]:
+    """Returns the lookup benchmarks, mapped to their function and relative number of iterations."""
+    lookups: dict[str, tuple[Callable[[], Awaitable[Any]], int]] = {}
+
+    for name, terms in SEARCH_TERMS.items():
+        search = getattr(ampharos, name)
+        search_many = getattr(ampharos, f"{name}_many")
+        random = getattr(ampharos, f"random_{name}")
+        term = cycle(terms)
+
+        lookups[name] = (lambda search=search, term=term: search(connection, term()), 1)
+        lookups[f"{name}_many"] = (lambda search_many=search_many, terms=terms: search_many(connection, terms), 1)
+        lookups[f"random_{name}"] = (lambda random=random: random(connection), 1)
+        lookups[f"random_{name}_10"] = (lambda random=random: random(connection, 10), 1)
+
+    for name in ("abilities", "items", "moves", "pokemon"):
+        iterate = getattr(ampharos, f"all_{name}")
+        lookups[f"all_{name}"] = (lambda iterate=iterate: exhaust(iterate(connection)), 10)
+
+    prefix = cycle(["p", "pi", "pik", "char", "thu"])
+    lookups["autocomplete"] = (lambda: ampharos.autocomplete(connection, ampharos.tables.Pokemon, prefix()), 1)
+
+    return lookups
+
+
+def memory_benchmarks() -> dict[str, tuple[Callable[[], Awaitable[Any]], int]]:
+    from ampharos import memory
+
+    def wrap(func: Callable[[], Any]) -> Callable[[], Awaitable[Any]]:
+        async def wrapper() -> Any:
+            return func()
+
+        return wrapper
+
+    lookups: dict[str, tuple[Callable[[], Awaitable[Any]], int]] = {}
+    for name, terms in SEARCH_TERMS.items():
+        search = getattr(memory, name)
+        random = getattr(memory, f"random_{name}")
+        term = cycle(terms)
+
+        lookups[name] = (wrap(lambda search=search, term=term: search(term())), 1)
+        lookups[f"random_{name}_10"] = (wrap(lambda random=random: random(10)), 1)
+
+    for name in ("abilities", "items", "moves", "pokemon"):
+        iterate = getattr(memory, f"all_{name}")
+        lookups[f"all_{name}"] = (wrap(lambda iterate=iterate: list(iterate())), 10)
+
+    prefix = cycle(["p", "pi", "pik", "char", "thu"])
+    lookups["autocomplete"] = (wrap(lambda: memory.autocomplete(ampharos.tables.Pokemon, prefix())), 1)
+
+    return lookups
+
+
+async def run_database(args: argparse.Namespace) -> dict[str, Result]:
+    from donphan import create_pool
+
+    from ampharos.index import clear_indexes
+
+    results: dict[str, Result] = {}
+    pool = await create_pool(args.dsn, set_as_default=True)
+
+    async with pool.acquire() as connection:
+        round_trips = RoundTrips()
+        with round_trips.attach(connection):
+            if args.cold:
+
+                async def cold_setup() -> None:
+                    await connection.execute("DROP SCHEMA IF EXISTS ampharos CASCADE")
+                    clear_indexes()
+                    await ampharos.setup_ampharos(connection)
+
+                results["setup_cold"] = await measure(cold_setup, max(1, args.iterations // 100), round_trips)
+
+            await ampharos.setup_ampharos(connection)
+            results["setup_warm"] = await measure(
+                lambda: ampharos.setup_ampharos(connection), max(1, args.iterations // 20), round_trips
+            )
+
+            for name, (func, divisor) in benchmarks(connection).items():
+                if args.filter and args.filter not in name:
+                    continue
+                await func()  # Warm up indexes and prepared statements
+                results[name] = await measure(func, max(1, args.iterations // divisor), round_trips)
+
+    # Every single lookup queries the database, so none being counted means queries bypass RoundTrips
+    for name in SEARCH_TERMS:
+        if name in results and results[name].round_trips < 1:
+            raise RuntimeError(f"{name} reported {results[name].round_trips} round trips, queries are not being counted")
+
+    await pool.close()
+    return results
+
+
+async def run_memory(args: argparse.Namespace) -> dict[str, Result]:
+    from ampharos import memory
+
+    async def load() -> None:
+        memory.load()
+
+    results = {"setup_cold": await measure(load, max(1, args.iterations // 100))}
+    for name, (func, divisor) in memory_benchmarks().items():
+        if args.filter and args.filter not in name:
+            continue
+        await func()
+        results[name] = await measure(func, max(1, args.iterations // divisor))
+    return results
+
+
+def report(results: dict[str, Result], baseline: dict[str, Any] | None) -> None:
+    header = f"{'benchmark':<24}{'p50 ms':>10}{'p90 ms':>10}{'p99 ms':>10}{'trips':>8}{'peak KiB':>11}"
+    if baseline is not None:
+        header += f"{'p50 vs base':>13}"
+    print(header)
+
+    for name, result in results.items():
+        line = (
+            f"{name:<24}{result.p50_ms:>10.3f}{result.p90_ms:>10.3f}{result.p99_ms:>10.3f}"
+            f"{result.round_trips:>8.1f}{result.peak_memory_kib:>11.1f}"
+        )
+        if baseline is not None and name in baseline:
+            line += f"{result.p50_ms / baseline[name]['p50_ms']:>12.2f}x"
+        print(line)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dsn", default=os.environ.get("POSTGRES_DSN"), help="defaults to $POSTGRES_DSN")
+    parser.add_argument("--backend", choices=("database", "memory"), default="database")
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--cold", action="store_true", help="drop the ampharos schema to time a full load")
+    parser.add_argument("--filter", help="only run benchmarks containing this string")
+    parser.add_argument("--output", type=Path, help="write the results to a JSON file")
+    parser.add_argument("--compare", type=Path, help="compare against a previous JSON output")
+    args = parser.parse_args()
+
+    # Skipped rows in the bundled data are reported on every load
+    logging.getLogger("ampharos").setLevel(logging.ERROR)
+
+    if args.backend == "database":
+        if args.dsn is None:
+            parser.error("--dsn or $POSTGRES_DSN is required for the database backend")
+        results = asyncio.run(run_database(args))
+    else:
+        results = asyncio.run(run_memory(args))
+
+    baseline = json.loads(args.compare.read_text())["results"] if args.compare else None
+    report(results, baseline)
+
+    if args.output:
+        output = {
+            "meta": {
+                "ampharos": ampharos.__version__,
+                "backend": args.backend,
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "iterations": args.iterations,
+            },
+            "results": {name: asdict(result) for name, result in results.items()},
+        }
+        args.output.write_text(json.dumps(output, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""Measures the time taken to import ampharos in a fresh interpreter.
+
+Usage: python benchmarks/import_time.py [--runs N]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+STATEMENTS = {
+    "import ampharos": "import ampharos",
+    "import ampharos.types": "import ampharos.types",
+    "first use (ampharos.pokemon)": "import ampharos; ampharos.pokemon",
+    "eager (all submodules)": "import ampharos.search, ampharos.setup, ampharos.memory",
+}
+
+TEMPLATE = "import time; start = time.perf_counter(); {statement}; print(time.perf_counter() - start)"
+
+
+def measure(statement: str, runs: int) -> list[float]:
+    timings = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", TEMPLATE.format(statement=statement)], check=True, capture_output=True, text=True
+        ).stdout
+        timings.append(float(output))
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    for name, statement in STATEMENTS.items():
+        timings = measure(statement, args.runs)
+        print(f"{name:<32} median {statistics.median(timings) * 1000:8.2f}ms  min {min(timings) * 1000:8.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,8 @@
 from unittest import TestCase
 
-from ampharos import setup_ampharos
+from ampharos import setup_ampharos, tables
+from ampharos.index import pg_trgm_enabled, set_pg_trgm
+from ampharos.views import POKEMON_VIEW, create_pokemon_view, drop_pokemon_view
 
 from .utils import async_test, with_connection
 
@@ -10,3 +12,47 @@ class CreateTest(TestCase):
     @with_connection
     async def test_setup_ampharos(self, connection):
         await setup_ampharos(connection)
+
+    @async_test
+    @with_connection
+    async def test_setup_ampharos_unchanged(self, connection):
+        assert await setup_ampharos(connection) == {}
+
+    @async_test
+    @with_connection
+    async def test_setup_ampharos_disables_pg_trgm(self, connection):
+        set_pg_trgm()
+        await setup_ampharos(connection)
+
+        assert not pg_trgm_enabled()
+
+    @async_test
+    @with_connection
+    async def test_setup_ampharos_removed_reference(self, connection):
+        # A removed Pokemon which is still referenced by a table whose data has not changed
+        await connection.execute(f"INSERT INTO {tables.Pokemon._name} (term, dex_no) VALUES ('missingno', 0)")
+        await connection.execute(
+            f"INSERT INTO {tables.PokemonNames._name} (term, english) VALUES ('missingno', 'MissingNo.')"
+        )
+        await connection.execute(f"UPDATE {tables.Metadata._name} SET hash = '' WHERE name = $1", tables.Pokemon._name)
+
+        timings = await setup_ampharos(connection)
+
+        assert tables.PokemonNames._name in timings
+        assert await connection.fetchval(f"SELECT count(*) FROM {tables.Pokemon._name} WHERE term = 'missingno'") == 0
+
+    @async_test
+    @with_connection
+    async def test_setup_ampharos_refreshes_view(self, connection):
+        query = f"SELECT data->'name'->>1 FROM {POKEMON_VIEW} WHERE term = 'pikachu'"
+
+        # A view created from data which has since been synchronised, but is no longer used
+        await connection.execute(f"UPDATE {tables.PokemonNames._name} SET english = 'Pikachew' WHERE term = 'pikachu'")
+        await connection.execute(f"UPDATE {tables.Metadata._name} SET hash = '' WHERE name = $1", tables.PokemonNames._name)
+        await create_pokemon_view(connection)
+        try:
+            assert await connection.fetchval(query) == "Pikachew"
+            await setup_ampharos(connection)
+            assert await connection.fetchval(query) == "Pikachu"
+        finally:
+            await drop_pokemon_view(connection)
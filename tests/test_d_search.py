@@ -1,8 +1,35 @@
-from unittest import TestCase
+import asyncio
+from unittest import SkipTest, TestCase
 
-from ampharos import pokemon
+import asyncpg
 
-from .utils import async_test, with_connection
+from ampharos import (
+    ability,
+    add_hook,
+    all_abilities,
+    all_pokemon,
+    autocomplete,
+    find_moves,
+    find_pokemon,
+    instrument,
+    move,
+    pokemon,
+    pokemon_many,
+    random_item,
+    random_pokemon,
+    remove_hook,
+    set_max_concurrency,
+    set_prepared_statements,
+    tables,
+)
+from ampharos.index import create_trigram_indexes, set_pg_trgm
+from ampharos.instrumentation import Metrics
+from ampharos.statements import prepared_statements_enabled
+from ampharos.tables import Category, Typing
+from ampharos.views import create_pokemon_view, drop_pokemon_view, set_pokemon_view
+
+from .env import POSTGRES_DSN
+from .utils import async_test, with_connection, with_pool
 
 
 class SearchTest(TestCase):
@@ -13,3 +40,253 @@ class SearchTest(TestCase):
 
         assert record is not None
         assert record._term == "pikachu"
+
+    @async_test
+    @with_connection
+    async def test_search_pokemon_many(self, connection):
+        records = await pokemon_many(connection, ["pikachew", "25", "zzzzzzzz"])
+
+        assert [record and record._term for record in records] == ["pikachu", "pikachu", None]
+
+    @async_test
+    @with_connection
+    async def test_search_pokemon_invalid_numbers(self, connection):
+        # Numbers out of range of the Pokedex, and digits which are not decimal, do not abort the batch
+        records = await pokemon_many(connection, ["99999", "0", "²", "25"])
+
+        assert [record and record._term for record in records[:2]] == [None, None]
+        assert records[3] is not None and records[3]._term == "pikachu"
+        assert await pokemon(connection, "99999") is None
+        await pokemon(connection, "²")
+
+    @async_test
+    @with_connection
+    async def test_search_pokemon_evolutions(self, connection):
+        record = await pokemon(connection, "ivysaur")
+
+        assert record is not None
+        assert [evolution._term for evolution in record.evolutions] == ["venusaur"]
+        assert [evolution._term for evolution in record.pre_evolutions] == ["bulbasaur"]
+
+    @async_test
+    @with_connection
+    async def test_search_pokemon_abilities(self, connection):
+        record = await pokemon(connection, "pikachu")
+
+        assert record is not None and record.abilities is not None
+        assert record.abilities.primary is not None
+        assert record.abilities.primary._term == "static"
+        assert record.abilities.primary.name == "Static"
+
+    @async_test
+    @with_connection
+    async def test_search_pokemon_names(self, connection):
+        records = await pokemon_many(connection, ["Pikachu", "ぴかちゅう", "ﾋﾟｶﾁｭｳ", "Flabebe"])
+
+        assert [record and record._term for record in records] == ["pikachu", "pikachu", "pikachu", "flabebe"]
+
+    @async_test
+    @with_connection
+    async def test_autocomplete(self, connection):
+        assert await autocomplete(connection, tables.Pokemon, "Bulb") == ["bulbasaur"]
+
+        with self.assertRaises(ValueError):
+            await autocomplete(connection, tables.PokemonNames, "Bulb")
+
+    @async_test
+    @with_connection
+    async def test_find_pokemon(self, connection):
+        records = await find_pokemon(connection, typing=(Typing.FIRE, Typing.FLYING), speed=(101, None))
+
+        assert [record._term for record in records] == ["talonflame"]
+
+    @async_test
+    @with_connection
+    async def test_find_moves(self, connection):
+        records = await find_moves(connection, category=Category.SPECIAL, power=(90, None), order_by="power", limit=3)
+
+        assert len(records) == 3
+        assert all(record.power is not None and record.power >= 90 for record in records)
+        assert [record.power for record in records] == sorted(record.power for record in records)
+
+    @async_test
+    @with_connection
+    async def test_random(self, connection):
+        records = await random_pokemon(connection, 5)
+        assert len({record._term for record in records}) == 5
+
+        count = await connection.fetchval(f"SELECT COUNT(*) FROM {tables.Items._name}")
+        assert len({record._term for record in await random_item(connection, count)}) == count
+
+        with self.assertRaises(ValueError):
+            await random_item(connection, count + 1)
+
+    @async_test
+    @with_connection
+    async def test_find_by_name(self, connection):
+        records = await find_pokemon(connection, typing=["fire", Typing.FLYING], speed=(101, None))
+        assert [record._term for record in records] == ["talonflame"]
+
+        records = await find_moves(connection, type="FIRE", category="special")
+        assert records == await find_moves(connection, type=Typing.FIRE, category=Category.SPECIAL)
+        assert len(records) > 1
+
+        with self.assertRaises(ValueError):
+            await find_moves(connection, type="FIER")
+
+    @async_test
+    @with_connection
+    async def test_instrument(self, connection):
+        metrics = Metrics()
+        add_hook(metrics.record)
+        try:
+            with instrument() as traces:
+                await pokemon_many(connection, ["pikachu", "raichu"])
+                await pokemon(connection, "pikachew")
+        finally:
+            remove_hook(metrics.record)
+
+        assert [trace.call for trace in traces] == ["search.pokemon_many", "search.pokemon"]
+        assert traces[0].statements and traces[0].rows >= 2
+        assert "hydration" in traces[0].phases
+        assert metrics.export()["calls_total"] == {"search.pokemon_many": 1, "search.pokemon": 1}
+
+    @async_test
+    @with_connection
+    async def test_instrument_failing_hook(self, connection):
+        def hook(trace):
+            raise RuntimeError
+
+        add_hook(hook)
+        try:
+            with self.assertLogs("ampharos.instrumentation", "ERROR"):
+                record = await pokemon(connection, "pikachu")
+        finally:
+            remove_hook(hook)
+
+        assert record is not None and record._term == "pikachu"
+
+    @async_test
+    @with_pool
+    async def test_search_pool(self, pool):
+        set_max_concurrency(1)
+        try:
+            records = await pokemon_many(pool, ["pikachew", "25", "ivysaur"])
+            count = 0
+            async for record in all_pokemon(pool, batch_size=500):
+                count += 1
+        finally:
+            set_max_concurrency(4)
+
+        assert [record and record._term for record in records] == ["pikachu", "pikachu", "ivysaur"]
+        assert records[2] is not None and [evolution._term for evolution in records[2].evolutions] == ["venusaur"]
+        assert count > 1000
+
+    @async_test
+    @with_pool
+    async def test_search_pool_nested(self, pool):
+        async def lookup_all() -> int:
+            count = 0
+            async for record in all_abilities(pool):
+                count += (await ability(pool, record._term)) == record
+            return count
+
+        # Lookups made while iterating must not wait on the connection held by the iteration
+        set_max_concurrency(1)
+        try:
+            count = await asyncio.wait_for(lookup_all(), 30)
+        finally:
+            set_max_concurrency(4)
+        assert count > 200
+
+        # Nor on the connections held by as many concurrent iterations as the limit
+        counts = await asyncio.wait_for(asyncio.gather(*(lookup_all() for _ in range(4))), 30)
+        assert counts == [count] * 4
+
+    @async_test
+    async def test_prepared_statement_deallocated(self):
+        connection = await asyncpg.connect(POSTGRES_DSN)
+        try:
+            await pokemon_many(connection, ["pikachu"])
+
+            # Statements deallocated on the server are prepared again
+            await connection.execute("DEALLOCATE ALL")
+            records = await pokemon_many(connection, ["pikachu"])
+            assert prepared_statements_enabled()
+            assert await connection.fetchval("SELECT count(*) FROM pg_prepared_statements")
+        finally:
+            set_prepared_statements()
+            await connection.close()
+
+        assert [record and record._term for record in records] == ["pikachu"]
+
+    @async_test
+    async def test_prepared_statement_fallback(self):
+        connection = await asyncpg.connect(POSTGRES_DSN)
+        try:
+            # Simulate a pooler running statements on a server connection they were not prepared on
+            for _ in range(3):
+                await pokemon_many(connection, ["pikachu"])
+                await connection.execute("DEALLOCATE ALL")
+            records = await pokemon_many(connection, ["pikachu"])
+            assert not prepared_statements_enabled()
+        finally:
+            set_prepared_statements()
+            await connection.close()
+
+        assert [record and record._term for record in records] == ["pikachu"]
+
+    @async_test
+    async def test_prepared_statement_pool(self):
+        # Without a statement cache, only the prepared statements are held on the server
+        pool = await asyncpg.create_pool(POSTGRES_DSN, min_size=1, max_size=1, statement_cache_size=0)
+        assert pool is not None
+        try:
+            names = []
+            for _ in range(2):
+                async with pool.acquire() as connection:
+                    records = await pokemon_many(connection, ["pikachu", "25"])
+                    names.append(
+                        {record["name"] for record in await connection.fetch("SELECT name FROM pg_prepared_statements")}
+                    )
+        finally:
+            await pool.close()
+
+        # Statements are reused across acquisitions of the same connection
+        assert names[0] and names[0] == names[1]
+        assert prepared_statements_enabled()
+        assert [record and record._term for record in records] == ["pikachu", "pikachu"]
+
+    @async_test
+    @with_connection
+    async def test_pokemon_view(self, connection):
+        search_terms = ["ivysaur", "pikachu", "25", "mega charizard x"]
+        expected = await pokemon_many(connection, search_terms)
+
+        await create_pokemon_view(connection)
+        set_pokemon_view()
+        try:
+            records = await pokemon_many(connection, search_terms)
+        finally:
+            set_pokemon_view(False)
+            await drop_pokemon_view(connection)
+
+        assert records == expected
+        assert records[0] is not None and [evolution._term for evolution in records[0].pre_evolutions] == ["bulbasaur"]
+
+    @async_test
+    @with_connection
+    async def test_search_pg_trgm(self, connection):
+        if not await connection.fetchval("SELECT EXISTS(SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm')"):
+            raise SkipTest("pg_trgm is not available")
+
+        await create_trigram_indexes(connection)
+        set_pg_trgm()
+        try:
+            record = await move(connection, "thundrbolt")
+            records = await pokemon_many(connection, ["pikachew", "zzzzzzzz"])
+        finally:
+            set_pg_trgm(False)
+
+        assert record is not None and record._term == "thunderbolt"
+        assert [record and record._term for record in records] == ["pikachu", None]
@@ -0,0 +1,49 @@
+import difflib
+import json
+from unittest import TestCase
+
+from ampharos import types
+from ampharos.index import EvolutionGraph, TermIndex
+from ampharos.utils import get_base_dir
+
+
+class IndexTest(TestCase):
+    def setUp(self):
+        with open(get_base_dir() / "data/pokemon.json") as f:
+            self.terms = [item["term"] for item in json.load(f)]
+        self.index = TermIndex(self.terms)
+
+    def test_exact_match(self):
+        assert self.index.get_close_matches("pikachu", 1) == ["pikachu"]
+
+    def test_matches_difflib(self):
+        for word in ("pikachew", "charzard", "bulbasore", "mega charizard", "mewtoo", "zzzzzz"):
+            expected = difflib.get_close_matches(word, self.terms)
+            assert self.index.get_close_matches(word) == expected, word
+
+
+class EvolutionGraphTest(TestCase):
+    def test_family(self):
+        graph = EvolutionGraph([("bulbasaur", "ivysaur"), ("ivysaur", "venusaur")])
+        assert graph.family("ivysaur") == ["ivysaur", "bulbasaur", "venusaur"]
+        assert graph.pre_evolutions("ivysaur") == ["bulbasaur"]
+
+    def test_cycle(self):
+        graph = EvolutionGraph([("a", "b"), ("b", "a"), ("c", "c")])
+        assert graph.family("a") == ["a", "b"]
+        assert graph.family("c") == ["c"]
+
+    def test_cycle_pokemon(self):
+        def family() -> tuple[types.Pokemon, types.Pokemon]:
+            a, b = (
+                types.Pokemon(term, 0, "", types.PokemonName(term, term, None, None), None, [], None, None, None)
+                for term in "ab"
+            )
+            a.evolutions.append(b)
+            b.evolutions.append(a)
+            return a, b
+
+        # Pokemon in a cycle are compared without following their evolutions
+        a, b = family()
+        assert (a, b) == family()
+        assert a != b
@@ -0,0 +1,64 @@
+from unittest import TestCase
+
+from ampharos import memory, tables
+
+
+class MemoryTest(TestCase):
+    def test_search_pokemon(self):
+        record = memory.pokemon("pikachew")
+
+        assert record is not None
+        assert record._term == "pikachu"
+
+    def test_evolutions(self):
+        record = memory.pokemon("ivysaur")
+
+        assert record is not None
+        assert [evolution._term for evolution in record.evolutions] == ["venusaur"]
+        assert [evolution._term for evolution in record.pre_evolutions] == ["bulbasaur"]
+
+    def test_search_pokedex_number(self):
+        record = memory.pokemon("25")
+
+        assert record is not None
+        assert record._term == "pikachu"
+        assert memory.pokemon("99999") is None
+        memory.pokemon("²")
+
+    def test_random_pokemon(self):
+        records = memory.random_pokemon(3)
+
+        assert len({record._term for record in records}) == 3
+
+        with self.assertRaises(ValueError):
+            memory.random_pokemon(sum(1 for _ in memory.all_pokemon()) + 1)
+
+    def test_interned(self):
+        bulbasaur = memory.pokemon("bulbasaur")
+        ivysaur = memory.pokemon("ivysaur")
+
+        assert bulbasaur is not None and ivysaur is not None
+        assert bulbasaur.abilities is not None and ivysaur.abilities is not None
+        assert bulbasaur.abilities.primary is ivysaur.abilities.primary
+        assert bulbasaur.typing is not None and bulbasaur.typing._term == "bulbasaur"
+        assert len({bulbasaur, ivysaur, memory.pokemon("bulbasaur")}) == 2
+
+    def test_search_pokemon_names(self):
+        for search_term in ("Fushigidane", "フシギダネ", "ふしぎだね", "フシギダ"):
+            record = memory.pokemon(search_term)
+
+            assert record is not None
+            assert record._term == "bulbasaur"
+
+    def test_autocomplete(self):
+        assert memory.autocomplete(tables.Moves, "Thunder P") == ["thunder punch"]
+        assert memory.autocomplete(tables.Pokemon, "ぴか") == ["pikachu"]
+        assert len(memory.autocomplete(tables.Items, "", 5)) == 5
+
+        with self.assertRaises(ValueError):
+            memory.autocomplete(tables.PokemonNames, "Bulb")
+
+    def test_sanitised(self):
+        # Rows the database would reject, such as moves without a type, are not loaded
+        assert all(move.type is not None for move in memory.all_moves())
+        assert len(list(memory.all_moves())) == 758
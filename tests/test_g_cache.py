@@ -0,0 +1,67 @@
+import time
+from unittest import TestCase
+
+from ampharos import move, pokemon, setup_ampharos
+from ampharos.cache import MISSING, LRUCache, cache_info, clear_cache, disable_cache, enable_cache
+
+from .utils import async_test, with_connection
+
+
+class CacheTest(TestCase):
+    def tearDown(self):
+        disable_cache()
+
+    def test_eviction(self):
+        cache: LRUCache[str, int] = LRUCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is MISSING
+        assert cache.get("c") == 3
+
+    def test_expiry(self):
+        cache: LRUCache[str, int] = LRUCache(ttl=0.01)
+        cache.set("a", 1)
+        time.sleep(0.02)
+
+        assert cache.get("a") is MISSING
+
+    @async_test
+    @with_connection
+    async def test_cached(self, connection):
+        enable_cache(maxsize=16)
+        first = await pokemon(connection, "pikachu")
+        second = await pokemon(connection, "pikachu")
+
+        # Search terms which resolve to the same term share a single result
+        third = await pokemon(connection, "pikachew")
+
+        assert first is not None and first is second and first is third
+        assert cache_info() == (1, 2, 16, 1)
+
+        clear_cache()
+        assert cache_info().currsize == 0
+
+    @async_test
+    @with_connection
+    async def test_cached_results(self, connection):
+        search_terms = ["THUNDERBOLT", "Thunderbolt", "thunderbolt", " thunderbolt ", "thundrbolt", "zzzzzzzz"]
+        expected = [await move(connection, search_term) for search_term in search_terms]
+
+        enable_cache()
+        for _ in range(2):
+            assert [await move(connection, search_term) for search_term in search_terms] == expected
+
+    @async_test
+    @with_connection
+    async def test_cache_invalidated(self, connection):
+        enable_cache()
+        await pokemon(connection, "pikachu")
+        await setup_ampharos(connection)
+
+        assert cache_info().currsize == 0
+        await pokemon(connection, "pikachu")
+        assert cache_info().misses == 2
@@ -0,0 +1,18 @@
+from unittest import TestCase
+
+from ampharos.snapshot import _decode_table, _encode_table
+from ampharos.tables import ALL_TABLES, TRANSFORMERS
+from ampharos.utils import load_data
+
+
+class SnapshotTest(TestCase):
+    def test_round_trip(self):
+        for table in ALL_TABLES:
+            data = load_data(table.__name__.lower())
+            transformers = TRANSFORMERS.get(table, {})
+            expected = [
+                tuple(transformers.get(column.name, lambda x: x)(item[column.name]) for column in table._columns)
+                for item in data
+            ]
+
+            assert _decode_table(table, memoryview(_encode_table(table, data))) == expected
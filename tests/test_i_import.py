@@ -0,0 +1,22 @@
+import subprocess
+import sys
+from unittest import TestCase
+
+import ampharos
+from ampharos import search
+
+
+class ImportTest(TestCase):
+    def test_lazy_import(self):
+        code = "import sys, ampharos; print(any(name in sys.modules for name in ('asyncpg', 'donphan', 'ampharos.tables')))"
+        output = subprocess.run((sys.executable, "-c", code), check=True, capture_output=True, text=True).stdout
+
+        assert output.strip() == "False"
+
+    def test_exports(self):
+        assert set(search.__all__) <= set(ampharos.__all__)
+        assert ampharos.pokemon is search.pokemon
+
+    def test_all(self):
+        assert sorted(ampharos.__all__) == sorted(("tables", *ampharos._EXPORTS))
+        assert all(getattr(ampharos, name) is not None for name in ampharos.__all__)
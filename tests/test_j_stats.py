@@ -0,0 +1,26 @@
+from unittest import SkipTest, TestCase
+
+from ampharos.stats import StatMatrix
+
+
+class StatMatrixTest(TestCase):
+    def setUp(self):
+        try:
+            import numpy  # NoQa
+        except ImportError:
+            raise SkipTest("numpy module not installed")
+
+        self.matrix = StatMatrix(
+            ["a", "b", "c"],
+            [(10, 10, 10, 10, 10, 10), (20, 20, 20, 20, 20, 20), (50, 5, 5, 5, 5, 100)],
+        )
+
+    def test_top(self):
+        assert self.matrix.top("speed", 2) == [("c", 100), ("b", 20)]
+        assert self.matrix.top("total", 1, ascending=True) == [("a", 60)]
+
+    def test_percentile(self):
+        assert round(self.matrix.percentile("c", "speed"), 2) == 83.33
+
+    def test_similar(self):
+        assert [term for term, _ in self.matrix.similar("a", 2)] == ["b", "c"]
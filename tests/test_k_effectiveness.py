@@ -0,0 +1,27 @@
+from unittest import TestCase
+
+from ampharos import memory
+from ampharos.effectiveness import defensive_multipliers, effectiveness, move_effectiveness
+from ampharos.tables import Typing
+
+
+class EffectivenessTest(TestCase):
+    def test_effectiveness(self):
+        assert effectiveness(Typing.ELECTRIC, Typing.WATER, Typing.FLYING) == 4.0
+        assert effectiveness(Typing.GROUND, Typing.FIRE, Typing.FLYING) == 0.0
+        assert effectiveness(Typing.FIRE, Typing.FIRE) == 0.5
+
+    def test_pokemon(self):
+        charizard = memory.pokemon("charizard")
+        thunderbolt = memory.move("thunderbolt")
+
+        assert charizard is not None and charizard.typing is not None and thunderbolt is not None
+        assert defensive_multipliers(charizard.typing)[Typing.ROCK] == 4.0
+        assert move_effectiveness(thunderbolt, charizard) == 2.0
+
+    def test_type_index(self):
+        index = memory.type_index()
+
+        assert "charizard" in index.weak_to(Typing.ROCK)
+        assert "charizard" in index.immune_to(Typing.GROUND)
+        assert "charizard" not in index.resists(Typing.WATER)